@@ -1,24 +1,57 @@
 """ Helper functions """
 
+import hashlib
 import json
 import logging
 import os
 import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from functools import partial
 from re import sub
+from threading import Lock
 from typing import Iterable
 
-from requests import ConnectionError, get
+from requests import ConnectionError, Session
+from requests.adapters import HTTPAdapter
 from ubiquerg import is_command_callable
+from urllib3.util.retry import Retry
 from yacman import select_config
 
 from .const import *
 from .exceptions import DownloadJsonError, MissingAssetError
 from .seqcol import SeqColClient
 
+try:
+    # faster JSON parsing of the server responses, if available
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = None
+
 _LOGGER = logging.getLogger(__name__)
 
+# HTTP session shared by the data requests, so that connections are reused
+_SESSION = None
+# the session may be first requested from several threads at once
+_SESSION_LOCK = Lock()
+# number of connections kept per host; requests to the servers may run concurrently
+_POOL_MAXSIZE = 32
+# retry policy for the transient server errors
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=[502, 503, 504],
+    raise_on_status=False,
+)
+# validators and bodies of the served JSON data, keyed by the request, least
+# recently used first; used to make conditional requests, so unchanged data
+# is not transferred again
+_ETAG_CACHE = OrderedDict()
+_ETAG_CACHE_LOCK = Lock()
+# number of the served JSON documents kept in the cache
+_ETAG_CACHE_MAXSIZE = 256
+
 __all__ = ["select_genome_config", "get_dir_digest", "block_iter_repr"]
 
 
@@ -60,11 +93,28 @@ def get_dir_digest(path, pm=None):
     Generate a MD5 digest that reflects just the contents of the
     files in the selected directory.
 
+    The files are hashed in a thread pool, which overlaps disk reads with
+    hashing. The file digests are ordered by the relative file paths in
+    byte order, i.e. as sorted in the C locale. The pipeline manager runs the
+    'find | md5sum | sort | md5sum' pipeline with LC_ALL=C, so both produce
+    the same digest. File names with backslashes or newlines are escaped by
+    md5sum, so the two digests may differ for those.
+
     :param str path: path to the directory to digest
     :param pypiper.PipelineManager pm: a pipeline object, optional.
-    The subprocess module will be used if not provided
+    The files are digested in this process if not provided
     :return str: a digest, e.g. a3c46f201a3ce7831d85cf4a125aa334
     """
+    if pm is None:
+        try:
+            return _dir_md5(path)
+        except OSError as e:
+            _LOGGER.warning(
+                "{}: could not calculate digest for '{}'".format(
+                    e.__class__.__name__, path
+                )
+            )
+            return
     if not is_command_callable("md5sum"):
         raise OSError(
             "md5sum command line tool is required for asset digest "
@@ -75,25 +125,64 @@ def get_dir_digest(path, pm=None):
     cmd = (
         "cd {}; find . -type f -not -path './"
         + BUILD_STATS_DIR
-        + "*' -exec md5sum {{}} \; | sort -k 2 | awk '{{print $1}}' | md5sum"
+        + "*' -exec md5sum {{}} \\; | LC_ALL=C sort -k 2 | awk '{{print $1}}'"
+        + " | md5sum"
     )
-    try:
-        x = pm.checkprint(cmd.format(path))
-    except AttributeError:
-        try:
-            from subprocess import check_output
-
-            x = check_output(cmd.format(path), shell=True).decode("utf-8")
-        except Exception as e:
-            _LOGGER.warning(
-                "{}: could not calculate digest for '{}'".format(
-                    e.__class__.__name__, path
-                )
-            )
-            return
+    x = pm.checkprint(cmd.format(path))
     return str(sub(r"\W+", "", x))  # strips non-alphanumeric
 
 
+def _dir_md5(path):
+    """
+    Digest the regular files in the directory tree in parallel
+
+    Each file is hashed separately, the hex digests are ordered by the
+    relative file paths in byte order and digested again. Symbolic links are
+    not followed and the build stats directory is skipped.
+
+    :param str path: path to the directory to digest
+    :return str: a digest of the directory contents
+    :raise NotADirectoryError: if the path does not point to a directory
+    """
+    if not os.path.isdir(path):
+        raise NotADirectoryError(f"Not a directory: {path}")
+    files = []
+    for root, dirs, names in os.walk(path):
+        for name in names:
+            file_path = os.path.join(root, name)
+            rel = "./" + os.path.relpath(file_path, path)
+            if (
+                rel.startswith("./" + BUILD_STATS_DIR)
+                or os.path.islink(file_path)
+                or not os.path.isfile(file_path)
+            ):
+                continue
+            files.append((os.fsencode(rel), file_path))
+    files.sort()
+    with ThreadPoolExecutor() as executor:
+        digests = executor.map(_file_md5, [f for _, f in files])
+        md5 = hashlib.md5()
+        for digest in digests:
+            md5.update(digest.encode() + b"\n")
+    return md5.hexdigest()
+
+
+def _file_md5(path, chunk_size=1 << 20):
+    """
+    Digest a file by reading it into a single reused buffer
+
+    :param str path: path to the file to digest
+    :param int chunk_size: size of the read buffer in bytes
+    :return str: a hex digest of the file contents
+    """
+    md5 = hashlib.md5()
+    buf = memoryview(bytearray(chunk_size))
+    with open(path, "rb", buffering=0) as f:
+        for n in iter(lambda: f.readinto(buf), 0):
+            md5.update(buf[:n])
+    return md5.hexdigest()
+
+
 def format_config_03_04(rgc, get_json_url):
     """
     upgrade the v0.3 config file format to v0.4 format:
@@ -289,27 +378,78 @@ def swap_names_in_tree(top, new_name, old_name):
     return True
 
 
-def send_data_request(url, params=None):
+def send_data_request(url, params=None, session=None):
     """
     Safely connect to the provided API endpoint and download the returned data.
 
     :param str url: server API endpoint
     :param dict params: query parameters
+    :param requests.Session session: session to send the request with,
+        the one shared by all the data requests is used by default
     :return dict: served data
     """
     _LOGGER.debug(f"Downloading JSON data; querying URL: {url}")
-    resp = get(url, params=params)
+    cache_key = (url, tuple(sorted(params.items())) if params else None)
+    cached = _ETAG_CACHE.get(cache_key)
+    headers = {"If-None-Match": cached[0]} if cached is not None else None
+    resp = (session or _get_session()).get(url, params=params, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        _LOGGER.debug("Served data not modified; using the cached response")
+        with _ETAG_CACHE_LOCK:
+            if cache_key in _ETAG_CACHE:
+                _ETAG_CACHE.move_to_end(cache_key)
+        return _loads_json(cached[1])
     if resp.ok:
         try:
-            return resp.json()
+            data = resp.json() if _json_loads is None else _json_loads(resp.content)
         except (json.JSONDecodeError, ValueError):
             _LOGGER.debug("The returned data is not a valid JSON")
             if resp.encoding == "utf-8" or resp.apparent_encoding == "ascii":
                 _LOGGER.debug(f"Request returned pain text data: {resp.text}")
                 return resp.text
+        else:
+            etag = resp.headers.get("ETag")
+            if etag:
+                with _ETAG_CACHE_LOCK:
+                    _ETAG_CACHE[cache_key] = (etag, resp.content)
+                    _ETAG_CACHE.move_to_end(cache_key)
+                    if len(_ETAG_CACHE) > _ETAG_CACHE_MAXSIZE:
+                        _ETAG_CACHE.popitem(last=False)
+            return data
     raise DownloadJsonError(resp)
 
 
+def _loads_json(content):
+    """
+    Parse JSON data served as bytes
+
+    :param bytes content: served data
+    :return dict: parsed data
+    """
+    return json.loads(content) if _json_loads is None else _json_loads(content)
+
+
+def _get_session():
+    """
+    Get the HTTP session shared by the data requests; create it if needed
+
+    :return requests.Session: the shared session
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = Session()
+                adapter = HTTPAdapter(
+                    pool_connections=16, pool_maxsize=_POOL_MAXSIZE, max_retries=_RETRY
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                # published only once it is ready to use
+                _SESSION = session
+    return _SESSION
+
+
 def replace_str_in_obj(object, x, y):
     """
     Replace strings in an object
@@ -343,9 +483,6 @@ def block_iter_repr(input_obj, numbered=False):
         input_obj = [input_obj]
     if not isinstance(input_obj, Iterable):
         raise TypeError("Input object has to be an Iterable")
-    return (
-        "\n"
-        + "\n".join([" {}. {}".format(i + 1, val) for i, val in (enumerate(input_obj))])
-        if numbered
-        else "\n - {}".format("\n - ".join(input_obj))
-    )
+    if numbered:
+        return "".join(f"\n {i}. {val}" for i, val in enumerate(input_obj, 1))
+    return "".join(f"\n - {val}" for val in input_obj)
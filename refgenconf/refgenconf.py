@@ -9,13 +9,15 @@ import shutil
 import signal
 import sys
 import warnings
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterable, Mapping
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from hashlib import md5
 from inspect import getfullargspec as finspect
+from stat import S_ISDIR
 from urllib.error import ContentTooShortError, HTTPError
-from urllib.parse import urlencode
-from urllib.request import urlopen, urlretrieve
+from weakref import WeakKeyDictionary
 
 import yacman
 from attmap import AttMap
@@ -26,13 +28,20 @@ from requests import ConnectionError
 from requests.exceptions import MissingSchema
 from rich.progress import BarColumn, Progress, TextColumn
 from rich.table import Table
-from ubiquerg import checksum, is_url, is_writable
-from ubiquerg import parse_registry_path as prp
-from ubiquerg import query_yes_no, untar
+from ubiquerg import (
+    create_lock,
+    is_url,
+    is_writable,
+    parse_registry_path,
+    query_yes_no,
+    remove_lock,
+    untar,
+)
 
 from .const import *
 from .exceptions import *
 from .helpers import (
+    _get_session,
     asciify_json_dict,
     block_iter_repr,
     get_dir_digest,
@@ -46,6 +55,38 @@ _LOGGER = logging.getLogger(__name__)
 
 __all__ = ["RefGenConf", "upgrade_config"]
 
+# name of the attribute that holds the values derived from the config data;
+# the leading underscores keep it out of the config mapping
+_CACHE_ATTR = "__cache"
+# name of the attribute that counts the nested update contexts; unlike the
+# cache it survives the re-initialization when the object is made writable
+_UPDATE_DEPTH_ATTR = "__update_depth"
+# cache key of the genome aliases mapping inverted to digests
+_ALIASES_BY_DIGEST = "aliases_by_digest"
+# cache key of a plain copy of the genome aliases mapping, to digests
+_DIGESTS_BY_ALIAS = "digests_by_alias"
+# cache key of the assets already warned about for a missing default tag
+_WARNED_DEFAULT_TAGS = "warned_default_tags"
+# cache key of the servers found compatible with the pull requests
+_COMPATIBLE_SERVERS = "compatible_servers"
+# cache key of the FASTA files opened by getseq, by path
+_FASTA_HANDLES = "fasta_handles"
+# cache key of the plugins loaded from the entry points, by hook
+_PLUGINS = "plugins"
+
+# numbers of positional arguments of the inspected functions
+_ARG_COUNTS = WeakKeyDictionary()
+
+# archive size units below terabytes, by the number of units in a gigabyte
+_UNITS_PER_GB = {"KB": 1000 ** 2, "MB": 1000, "GB": 1}
+
+# refgenie registry paths embedded in the strings to populate
+_REGISTRY_PATH_RE = re.compile(r"refgenie://([A-Za-z0-9_/\.\:]+)?")
+
+# name of the file in the data directory that records the digests of the
+# initialized FASTA files, by path, so unchanged files are not digested again
+_FASTA_DIGESTS_FILE = ".fasta_digests.json"
+
 
 def _handle_sigint(filepath):
     def handle(sig, frame):
@@ -53,7 +94,7 @@ def _handle_sigint(filepath):
         try:
             os.remove(filepath)
         except OSError:
-            _LOGGER.debug("'{}' not found, can't remove".format(filepath))
+            _LOGGER.debug("'%s' not found, can't remove", filepath)
         else:
             _LOGGER.info("Incomplete file '{}' was removed".format(filepath))
         sys.exit(0)
@@ -91,8 +132,13 @@ class RefGenConf(yacman.YacAttMap):
         """
 
         def _missing_key_msg(key, value):
-            _LOGGER.debug("Config lacks '{}' key. Setting to: {}".format(key, value))
+            _LOGGER.debug("Config lacks '%s' key. Setting to: %s", key, value)
 
+        # reset on every (re)initialization, e.g. when the file is re-read;
+        # the FASTA files opened by getseq are closed rather than leaked
+        if _CACHE_ATTR in self.__dict__:
+            self.close_fastas()
+        setattr(self, _CACHE_ATTR, {})
         super(RefGenConf, self).__init__(
             filepath=filepath,
             entries=entries,
@@ -110,7 +156,9 @@ class RefGenConf(yacman.YacAttMap):
             self[CFG_VERSION_KEY] = REQ_CFG_VERSION
         else:
             try:
-                version = float(version)
+                # YAML loaders already produce numbers for the usual values
+                if not isinstance(version, (int, float)):
+                    version = float(version)
             except ValueError:
                 _LOGGER.warning(
                     "Cannot parse config version as numeric: {}".format(version)
@@ -132,7 +180,7 @@ class RefGenConf(yacman.YacAttMap):
                     raise ConfigNotCompliantError(msg)
 
                 else:
-                    _LOGGER.debug("Config version is compliant: {}".format(version))
+                    _LOGGER.debug("Config version is compliant: %s", version)
 
         # initialize "genomes_folder"
         if CFG_FOLDER_KEY not in self:
@@ -189,6 +237,30 @@ class RefGenConf(yacman.YacAttMap):
 
     __nonzero__ = __bool__
 
+    def __enter__(self):
+        """
+        Make the object writable for the updates in the context
+
+        The contexts can be nested, e.g. several pulls can be run in a single
+        context; the file is then locked and written just once, when the
+        outermost context exits.
+
+        :return refgenconf.RefGenConf: writable object
+        """
+        depth = getattr(self, _UPDATE_DEPTH_ATTR, 0)
+        if depth:
+            setattr(self, _UPDATE_DEPTH_ATTR, depth + 1)
+            return self
+        rgc = super(RefGenConf, self).__enter__()
+        setattr(self, _UPDATE_DEPTH_ATTR, 1)
+        return rgc
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        depth = getattr(self, _UPDATE_DEPTH_ATTR, 1) - 1
+        setattr(self, _UPDATE_DEPTH_ATTR, depth)
+        if not depth:
+            super(RefGenConf, self).__exit__(exc_type, exc_val, exc_tb)
+
     @property
     def plugins(self):
         """
@@ -198,10 +270,19 @@ class RefGenConf(yacman.YacAttMap):
             are names of all possible hooks and values are dicts mapping
             registered functions names to their values
         """
-        return {
-            h: {ep.name: ep.load() for ep in iter_entry_points("refgenie.hooks." + h)}
-            for h in HOOKS
-        }
+        # the entry points are scanned and loaded once, not on every hook run
+        try:
+            return self._cache[_PLUGINS]
+        except KeyError:
+            plugins = {
+                h: {
+                    ep.name: ep.load()
+                    for ep in iter_entry_points("refgenie.hooks." + h)
+                }
+                for h in HOOKS
+            }
+            self._cache[_PLUGINS] = plugins
+            return plugins
 
     @property
     def genome_aliases(self):
@@ -227,16 +308,37 @@ class RefGenConf(yacman.YacAttMap):
         if CFG_GENOMES_KEY not in self or not self[CFG_GENOMES_KEY]:
             return table
         for genome, genome_dict in self[CFG_GENOMES_KEY].items():
-            if (
-                CFG_ALIASES_KEY not in self[CFG_GENOMES_KEY][genome]
-                or not self[CFG_GENOMES_KEY][genome][CFG_ALIASES_KEY]
-            ):
-                aliases = ""
-            else:
-                aliases = ", ".join(self[CFG_GENOMES_KEY][genome][CFG_ALIASES_KEY])
-            table.add_row(genome, aliases)
+            aliases = genome_dict.get(CFG_ALIASES_KEY)
+            table.add_row(genome, ", ".join(aliases) if aliases else "")
         return table
 
+    @property
+    def _cache(self):
+        """
+        Values derived from the config data, stored outside of the config mapping
+
+        :return dict: cached values
+        """
+        return getattr(self, _CACHE_ATTR)
+
+    def _folder_subdir(self, name):
+        """
+        Get the absolute path to a genome folder subdirectory
+
+        The path is cached by the unexpanded genome folder value, so it is
+        recomputed only if the genome folder changes.
+
+        :param str name: name of the subdirectory
+        :return str: absolute path to the subdirectory
+        """
+        key = (name, self.__getitem__(CFG_FOLDER_KEY, expand=False))
+        try:
+            return self._cache[key]
+        except KeyError:
+            path = os.path.abspath(os.path.join(self[CFG_FOLDER_KEY], name))
+            self._cache[key] = path
+            return path
+
     @property
     def data_dir(self):
         """
@@ -244,7 +346,7 @@ class RefGenConf(yacman.YacAttMap):
 
         :return str: path to the directory where the assets are stored
         """
-        return os.path.abspath(os.path.join(self[CFG_FOLDER_KEY], DATA_DIR))
+        return self._folder_subdir(DATA_DIR)
 
     @property
     def alias_dir(self):
@@ -253,7 +355,7 @@ class RefGenConf(yacman.YacAttMap):
 
         :return str: path to the directory where the assets are stored
         """
-        return os.path.abspath(os.path.join(self[CFG_FOLDER_KEY], ALIAS_DIR))
+        return self._folder_subdir(ALIAS_DIR)
 
     @property
     def file_path(self):
@@ -314,36 +416,18 @@ class RefGenConf(yacman.YacAttMap):
         """
         self.run_plugins(PRE_LIST_HOOK)
         refgens = self._select_genomes(genome=genome, order=order)
-        if include_tags:
-            self.run_plugins(POST_LIST_HOOK)
-            return OrderedDict(
-                [
-                    (
-                        g,
-                        sorted(
-                            _make_asset_tags_product(
-                                self[CFG_GENOMES_KEY][g][CFG_ASSETS_KEY], ":"
-                            ),
-                            key=order,
-                        ),
-                    )
-                    for g in refgens
-                    if CFG_ASSETS_KEY in self[CFG_GENOMES_KEY][g]
-                ]
-            )
+        genomes = self[CFG_GENOMES_KEY]
         self.run_plugins(POST_LIST_HOOK)
-        return OrderedDict(
-            [
-                (
-                    g,
-                    sorted(
-                        list(self[CFG_GENOMES_KEY][g][CFG_ASSETS_KEY].keys()), key=order
-                    ),
-                )
-                for g in refgens
-                if CFG_ASSETS_KEY in self[CFG_GENOMES_KEY][g]
-            ]
-        )
+        listing = OrderedDict()
+        for g in refgens:
+            assets = genomes[g].get(CFG_ASSETS_KEY)
+            if assets is None:
+                continue
+            listing[g] = sorted(
+                _make_asset_tags_product(assets, ":") if include_tags else assets,
+                key=order,
+            )
+        return listing
 
     def get_asset_table(
         self,
@@ -381,32 +465,26 @@ class RefGenConf(yacman.YacAttMap):
                     genome_dict = genomes_data[genome]
                     if CFG_ASSETS_KEY not in genome_dict:
                         continue
+                    # the same for every row of the genome
+                    aliases = ", ".join(genome_dict[CFG_ALIASES_KEY])
                     for asset, asset_dict in genome_dict[CFG_ASSETS_KEY].items():
-                        tags = list(asset_dict[CFG_ASSET_TAGS_KEY].keys())
-                        if (
-                            CFG_SEEK_KEYS_KEY
-                            not in asset_dict[CFG_ASSET_TAGS_KEY][tags[0]]
-                        ):
+                        tags_dict = asset_dict[CFG_ASSET_TAGS_KEY]
+                        tags = list(tags_dict.keys())
+                        first_tag = tags_dict[tags[0]]
+                        if CFG_SEEK_KEYS_KEY not in first_tag:
                             continue
-                        seek_keys = list(
-                            asset_dict[CFG_ASSET_TAGS_KEY][tags[0]][
-                                CFG_SEEK_KEYS_KEY
-                            ].keys()
-                        )
+                        seek_keys = ", ".join(first_tag[CFG_SEEK_KEYS_KEY])
                         table.add_row(
-                            ", ".join(genome_dict[CFG_ALIASES_KEY]),
-                            "{} ".format(asset) + it.format(", ".join(seek_keys)),
-                            ", ".join(tags),
+                            aliases, f"{asset} " + it.format(seek_keys), ", ".join(tags)
                         )
             else:
                 table.add_column("assets")
-                for genome in list(genomes_data.keys()):
-                    genome_dict = genomes_data[genome]
+                for genome_dict in genomes_data.values():
                     if CFG_ASSETS_KEY not in genome_dict:
                         continue
                     table.add_row(
                         ", ".join(genome_dict[CFG_ALIASES_KEY]),
-                        ", ".join(list(genome_dict[CFG_ASSETS_KEY].keys())),
+                        ", ".join(genome_dict[CFG_ASSETS_KEY].keys()),
                     )
             return table
 
@@ -454,17 +532,21 @@ class RefGenConf(yacman.YacAttMap):
         :return str: text representing genome-to-asset mapping
         """
         refgens = self._select_genomes(genome=genome, order=order)
+        genomes = self[CFG_GENOMES_KEY]
         make_line = partial(
             _make_genome_assets_line,
             offset_text=offset_text,
             genome_assets_delim=genome_assets_delim,
             asset_sep=asset_sep,
             order=order,
-            rjust=max(map(len, refgens) or [0]) + 2,
-        )
-        return "\n".join(
-            [make_line(g, self[CFG_GENOMES_KEY][g][CFG_ASSETS_KEY]) for g in refgens]
+            rjust=max((len(g) for g in refgens), default=0) + 2,
         )
+        lines = []
+        for g in refgens:
+            assets = genomes[g].get(CFG_ASSETS_KEY)
+            if assets is not None:
+                lines.append(make_line(g, assets))
+        return "\n".join(lines)
 
     def add(self, path, genome, asset, tag=None, seek_keys=None, force=False):
         """
@@ -478,6 +560,66 @@ class RefGenConf(yacman.YacAttMap):
         :param dict seek_keys: seek keys to add
         :param bool force: whether to force existing asset overwrite
         """
+        return self.batch_add(
+            [
+                dict(
+                    path=path,
+                    genome=genome,
+                    asset=asset,
+                    tag=tag,
+                    seek_keys=seek_keys,
+                    force=force,
+                )
+            ]
+        )[0]
+
+    def batch_add(self, entries):
+        """
+        Add multiple external assets to the config
+
+        The config file is locked, re-read and written just once for
+        all the assets.
+
+        :param Iterable[Mapping] entries: collection of the asset specifications,
+            each with the keyword arguments accepted by the add method
+        :return list[bool]: whether each of the assets has been added
+        """
+        results, additions = [], []
+        for entry in entries:
+            addition = self._prep_asset_addition(**entry)
+            results.append(addition is not None)
+            if addition is not None:
+                additions.append(addition)
+        if not additions:
+            return results
+        if not self.file_path:
+            for addition in additions:
+                self._add_asset_data(*addition)
+        else:
+            with self as rgc:
+                for addition in additions:
+                    rgc._add_asset_data(*addition)
+        for genome, asset, tag, _, _, _ in additions:
+            self._symlink_alias(genome, asset, tag)
+        return results
+
+    def _prep_asset_addition(
+        self, path, genome, asset, tag=None, seek_keys=None, force=False
+    ):
+        """
+        Validate the external asset and collect the data to add to the config
+
+        :param str path: a path to the asset to add; must exist and be relative
+            to the genome_folder
+        :param str genome: genome name
+        :param str asset: asset name
+        :param str tag: tag name
+        :param dict seek_keys: seek keys to add
+        :param bool force: whether to force existing asset overwrite
+        :return tuple | None: genome digest, asset, tag, tag data, seek keys and
+            whether the existing asset needs to be removed; None if the asset
+            should not be added
+        """
         try:
             genome = self.get_genome_alias_digest(alias=genome, fallback=True)
         except yacman.UndefinedAliasError:
@@ -485,7 +627,7 @@ class RefGenConf(yacman.YacAttMap):
                 "No digest defined for '{}'. Set an alias or pull an"
                 " asset to initialize.".format(genome)
             )
-            return False
+            return
         tag = tag or self.get_default_tag(genome, asset)
         abspath = os.path.join(self[CFG_FOLDER_KEY], path)
         remove = False
@@ -505,36 +647,39 @@ class RefGenConf(yacman.YacAttMap):
                 )
             ):
                 _LOGGER.info("Aborted by a user, asset no added")
-                return False
+                return
             remove = True
             _LOGGER.info("Will remove existing to overwrite")
         tag_data = {
             CFG_ASSET_PATH_KEY: path,
             CFG_ASSET_CHECKSUM_KEY: get_dir_digest(abspath) or "",
         }
-        msg = "Added asset: {}/{}:{} {}".format(
-            genome,
-            asset,
-            tag,
-            "" if not seek_keys else "with seek keys: {}".format(seek_keys),
+        return genome, asset, tag, tag_data, seek_keys, remove
+
+    def _add_asset_data(self, genome, asset, tag, tag_data, seek_keys, remove):
+        """
+        Insert the external asset data into the config
+
+        :param str genome: genome digest
+        :param str asset: asset name
+        :param str tag: tag name
+        :param dict tag_data: tag attributes to set
+        :param dict seek_keys: seek keys to add
+        :param bool remove: whether to remove the existing asset first
+        """
+        if remove:
+            self.cfg_remove_assets(genome, asset, tag)
+        self.update_tags(genome, asset, tag, tag_data)
+        self.update_seek_keys(genome, asset, tag, seek_keys or {asset: "."})
+        self.set_default_pointer(genome, asset, tag)
+        _LOGGER.info(
+            "Added asset: {}/{}:{} {}".format(
+                genome,
+                asset,
+                tag,
+                "" if not seek_keys else "with seek keys: {}".format(seek_keys),
+            )
         )
-        if not self.file_path:
-            if remove:
-                self.cfg_remove_assets(genome, asset, tag)
-            self.update_tags(genome, asset, tag, tag_data)
-            self.update_seek_keys(genome, asset, tag, seek_keys or {asset: "."})
-            self.set_default_pointer(genome, asset, tag)
-            _LOGGER.info(msg)
-        else:
-            with self as rgc:
-                if remove:
-                    rgc.cfg_remove_assets(genome, asset, tag)
-                rgc.update_tags(genome, asset, tag, tag_data)
-                rgc.update_seek_keys(genome, asset, tag, seek_keys or {asset: "."})
-                rgc.set_default_pointer(genome, asset, tag)
-                _LOGGER.info(msg)
-        self._symlink_alias(genome, asset, tag)
-        return True
 
     def get_symlink_paths(self, genome, asset=None, tag=None, all_aliases=False):
         """
@@ -554,18 +699,13 @@ class RefGenConf(yacman.YacAttMap):
         except yacman.UndefinedAliasError:
             return {}
         alias = _make_list_of_str(defined_aliases)
-        if asset:
-            tag = tag or self.get_default_tag(genome, asset)
-        return {
-            a: os.path.join(self.alias_dir, a, asset, tag)
-            if asset
-            else os.path.join(self.alias_dir, a)
-            for a in alias
-        }
+        alias_dir = self.alias_dir
+        if not asset:
+            return {a: os.path.join(alias_dir, a) for a in alias}
+        tag = tag or self.get_default_tag(genome, asset)
+        return {a: os.path.join(alias_dir, a, asset, tag) for a in alias}
 
-    def _symlink_alias(
-        self, genome, asset=None, tag=None, link_fun=lambda t, s: os.symlink(t, s)
-    ):
+    def _symlink_alias(self, genome, asset=None, tag=None, link_fun=None):
         """
         Go through the files in the asset directory and recreate the asset
         directory tree, but instead of copying files, create symbolic links
@@ -574,7 +714,8 @@ class RefGenConf(yacman.YacAttMap):
         :param str asset: asset name
         :param str tag: tag name
         :param callable link_fun: function to use to link files, e.g os.symlink
-            or os.link
+            or os.link. Symbolic links are created relative to the open
+            destination directories if not provided
         """
 
         def _rpl(x):
@@ -586,7 +727,9 @@ class RefGenConf(yacman.YacAttMap):
             """
             return x.replace(genome_digest, alias)
 
-        if not callable(link_fun) or len(finspect(link_fun).args) != 2:
+        if link_fun is not None and (
+            not callable(link_fun) or len(finspect(link_fun).args) != 2
+        ):
             raise TypeError(
                 "Linking function must be a two-arg function (target, destination)"
             )
@@ -600,28 +743,26 @@ class RefGenConf(yacman.YacAttMap):
         target_paths_mapping = self.get_symlink_paths(
             genome_digest, asset, tag, all_aliases=True
         )
+        rel_dirs, files = None, None
         for alias, path in target_paths_mapping.items():
             if not os.path.exists(path):
-                os.makedirs(path, exist_ok=True)
-                for root, dirs, files in os.walk(src_path):
-                    appendix = os.path.relpath(root, src_path)
-                    for directory in dirs:
-                        try:
-                            os.makedirs(os.path.join(path, appendix, _rpl(directory)))
-                        except FileExistsError:
-                            continue
-                    for file in files:
-                        try:
-                            rel = os.path.relpath(
-                                os.path.join(root, file), os.path.join(path, appendix)
-                            )
-                            new_path = os.path.join(path, appendix, _rpl(file))
-                            link_fun(rel, new_path)
-                        except FileExistsError:
-                            _LOGGER.warning(
-                                f"Could not create link, file exists: {new_path}"
-                            )
-                            continue
+                if rel_dirs is None:
+                    # the source tree is the same for every alias, scan it once
+                    rel_dirs, files = _scan_tree(src_path)
+                base_rel = os.path.relpath(src_path, path)
+                for directory in [path] + sorted(
+                    set(os.path.join(path, _rpl(d)) for d in rel_dirs)
+                ):
+                    os.makedirs(directory, exist_ok=True)
+                for rel_root, names in files.items():
+                    up = [os.pardir] * (rel_root.count(os.sep) + 1 if rel_root else 0)
+                    _link_files(
+                        target_dir=os.path.join(*up, base_rel, rel_root),
+                        dst_dir=os.path.join(path, _rpl(rel_root)),
+                        names=names,
+                        rename=_rpl,
+                        link_fun=link_fun,
+                    )
                 created.append(path)
         if created:
             _LOGGER.info(f"Created alias directories:{block_iter_repr(created)}")
@@ -667,13 +808,7 @@ class RefGenConf(yacman.YacAttMap):
         :return Iterable[str]: list of this configuration's reference genome
             assembly IDs
         """
-        return sorted(
-            [
-                self.get_genome_alias(x, fallback=True)
-                for x in self[CFG_GENOMES_KEY].keys()
-            ],
-            key=order,
-        )
+        return sorted(self._get_genome_aliases(self[CFG_GENOMES_KEY].keys()), key=order)
 
     def genomes_str(self, order=None):
         """
@@ -694,7 +829,7 @@ class RefGenConf(yacman.YacAttMap):
         strict_exists=None,
         enclosing_dir=False,
         all_aliases=False,
-        check_exist=lambda p: os.path.exists(p) or is_url(p),
+        check_exist=lambda p: is_url(p) or os.path.exists(p),
     ):
         """
         Seek path to a specified genome-asset-tag alias
@@ -733,10 +868,7 @@ class RefGenConf(yacman.YacAttMap):
         idx = 0
         if genome_name in genome_ids:
             idx = genome_ids.index(genome_name)
-        self._assert_gat_exists(genome_name, asset_name, tag_name)
-        asset_tag_data = self[CFG_GENOMES_KEY][genome_name][CFG_ASSETS_KEY][asset_name][
-            CFG_ASSET_TAGS_KEY
-        ][tag_name]
+        asset_tag_data = self._assert_gat_exists(genome_name, asset_name, tag_name)
         if not seek_key:
             if asset_name in asset_tag_data[CFG_SEEK_KEYS_KEY]:
                 seek_val = asset_tag_data[CFG_SEEK_KEYS_KEY][asset_name]
@@ -755,23 +887,24 @@ class RefGenConf(yacman.YacAttMap):
                     )
         if enclosing_dir:
             seek_val = ""
-        fullpath = os.path.join(
-            self.alias_dir, genome_digest, asset_name, tag_name, seek_val
-        )
-        fullpaths = [fullpath.replace(genome_digest, gid) for gid in genome_ids]
-        paths_existence = [check_exist(fp) for fp in fullpaths]
-        if all(paths_existence):
-            return fullpaths if all_aliases else fullpaths[idx]
-        nonexistent_pths = [
-            fullpaths[p] for p in [i for i, x in enumerate(paths_existence) if not x]
+        # only the path for the requested alias needs to be built and checked
+        # unless paths for all the aliases were requested
+        alias_dir = self.alias_dir
+        fullpaths = [
+            _alias_asset_path(
+                alias_dir, genome_digest, gid, asset_name, tag_name, seek_val
+            )
+            for gid in (genome_ids if all_aliases else [genome_ids[idx]])
         ]
-        msg = "For genome '{}' path to the asset '{}/{}:{}' doesn't exist: {}".format(
-            genome_name,
-            genome_name,
-            asset_name,
-            seek_key,
-            tag_name,
-            ", ".join(nonexistent_pths),
+        nonexistent_pths = [fp for fp in fullpaths if not check_exist(fp)]
+        if not nonexistent_pths or (
+            strict_exists is None and not _LOGGER.isEnabledFor(logging.DEBUG)
+        ):
+            return fullpaths if all_aliases else fullpaths[0]
+        msg = (
+            f"For genome '{genome_name}' path to the asset "
+            f"'{genome_name}/{asset_name}.{seek_key}:{tag_name}' doesn't exist: "
+            f"{', '.join(nonexistent_pths)}"
         )
         if strict_exists is None:
             _LOGGER.debug(msg)
@@ -779,7 +912,7 @@ class RefGenConf(yacman.YacAttMap):
             raise OSError(msg)
         else:
             warnings.warn(msg, RuntimeWarning)
-        return fullpaths if all_aliases else fullpaths[idx]
+        return fullpaths if all_aliases else fullpaths[0]
 
     def seekr(
         self,
@@ -802,31 +935,56 @@ class RefGenConf(yacman.YacAttMap):
             URL request, given server URL and endpoint operationID
         :return str: path to the asset
         """
-        good_servers = [
-            s for s in self[CFG_SERVERS_KEY] if get_url(s, API_ID_ASSET_PATH)
-        ]
+        asset_path_urls = OrderedDict()
+        for server in self[CFG_SERVERS_KEY]:
+            asset_path_url = get_url(server, API_ID_ASSET_PATH)
+            if asset_path_url:
+                asset_path_urls[server] = asset_path_url
+        good_servers = list(asset_path_urls.keys())
         _LOGGER.debug(f"Compatible refgenieserver instances: {good_servers}")
-        for url in good_servers:
-            try:
-                genome_digest = self.get_genome_alias_digest(alias=genome_name)
-            except yacman.UndefinedAliasError:
-                _LOGGER.info(f"No local digest for genome alias: {genome_name}")
-                if not self.set_genome_alias(
+        try:
+            genome_digest = self.get_genome_alias_digest(alias=genome_name)
+        except yacman.UndefinedAliasError:
+            _LOGGER.info(f"No local digest for genome alias: {genome_name}")
+            for url in good_servers:
+                if self.set_genome_alias(
                     genome=genome_name, servers=[url], create_genome=True
                 ):
-                    continue
-                genome_digest = self.get_genome_alias_digest(alias=genome_name)
-
-            asset_seek_key_url = get_url(url, API_ID_ASSET_PATH).format(
+                    break
+            else:
+                return None
+            genome_digest = self.get_genome_alias_digest(alias=genome_name)
+        asset_seek_key_urls = [
+            asset_path_url.format(
                 genome=genome_digest, asset=asset_name, seek_key=seek_key or asset_name
             )
-            if asset_seek_key_url is None:
-                continue
-            asset_seek_key_target = send_data_request(
-                asset_seek_key_url,
-                params={"tag": tag_name, "remoteClass": remote_class},
-            )
-            return asset_seek_key_target
+            for asset_path_url in asset_path_urls.values()
+        ]
+        params = {"tag": tag_name, "remoteClass": remote_class}
+        if not asset_seek_key_urls:
+            return None
+        if len(asset_seek_key_urls) == 1:
+            return send_data_request(asset_seek_key_urls[0], params=params)
+        # query all the servers at once and use the first successful response
+        executor = ThreadPoolExecutor(max_workers=len(asset_seek_key_urls))
+        futures = [
+            executor.submit(send_data_request, asset_seek_key_url, params=params)
+            for asset_seek_key_url in asset_seek_key_urls
+        ]
+        try:
+            for future in as_completed(futures):
+                try:
+                    return future.result()
+                except (ConnectionError, DownloadJsonError) as e:
+                    _LOGGER.debug(f"Remote path request failed: {e}")
+            # none of the servers succeeded, report the most preferred one's error
+            return futures[0].result()
+        finally:
+            # the requests that have not started are not needed; the running
+            # ones are waited for, so none outlive the call
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
 
     def seek_src(
         self,
@@ -836,7 +994,7 @@ class RefGenConf(yacman.YacAttMap):
         seek_key=None,
         strict_exists=None,
         enclosing_dir=False,
-        check_exist=lambda p: os.path.exists(p) or is_url(p),
+        check_exist=lambda p: is_url(p) or os.path.exists(p),
     ):
         """
         Seek path to a specified genome-asset-tag
@@ -864,54 +1022,40 @@ class RefGenConf(yacman.YacAttMap):
         """
         tag_name = tag_name or self.get_default_tag(genome_name, asset_name)
         _LOGGER.debug(
-            "getting asset: '{}/{}.{}:{}'".format(
-                genome_name, asset_name, seek_key, tag_name
-            )
+            "getting asset: '%s/%s.%s:%s'", genome_name, asset_name, seek_key, tag_name
         )
-        if not callable(check_exist) or len(finspect(check_exist).args) != 1:
+        if not callable(check_exist) or _count_args(check_exist) != 1:
             raise TypeError("Asset existence check must be a one-arg function.")
+        asset_tag_data = self._assert_gat_exists(genome_name, asset_name, tag_name)
+        tried = []
         # 3 'path' key options supported
         # option1: absolute path
         # get just the saute path value from the config
-        path_val = _genome_asset_path(
-            self[CFG_GENOMES_KEY],
-            genome_name,
-            asset_name,
-            tag_name,
-            enclosing_dir=True,
-            no_tag=True,
-            seek_key=None,
-        )
-        _LOGGER.debug("Trying absolute path: {}".format(path_val))
-        if seek_key:
-            path = os.path.join(path_val, seek_key)
-        else:
-            path = path_val
-        if os.path.isabs(path) and check_exist(path):
-            return path
+        path_val = asset_tag_data[CFG_ASSET_PATH_KEY]
+        _LOGGER.debug("Trying absolute path: %s", path_val)
+        abs_path = os.path.join(path_val, seek_key) if seek_key else path_val
+        if os.path.isabs(abs_path):
+            if check_exist(abs_path):
+                return abs_path
+            tried.append(abs_path)
         genome_name = self.get_genome_alias_digest(genome_name, fallback=True)
         # option2: relative to genome_folder/{genome} (default, canonical)
-        path = _genome_asset_path(
-            self[CFG_GENOMES_KEY],
-            genome_name,
-            asset_name,
-            tag_name,
-            seek_key,
-            enclosing_dir,
+        path = _tag_asset_path(
+            asset_tag_data, genome_name, asset_name, tag_name, seek_key, enclosing_dir
         )
-        fullpath = os.path.join(self.data_dir, genome_name, path)
+        data_dir = self.data_dir
+        fullpath = os.path.join(data_dir, genome_name, path)
         _LOGGER.debug(
-            "Trying relative to genome_folder/genome/_data ({}/{}/{}): {}".format(
-                self[CFG_FOLDER_KEY], genome_name, DATA_DIR, fullpath
-            )
+            "Trying relative to genome_folder/genome/_data (%s): %s", data_dir, fullpath
         )
         if check_exist(fullpath):
             return fullpath
+        tried.append(fullpath)
         # option3: relative to the genome_folder (if option2 does not exist)
         gf_relpath = os.path.join(
             self[CFG_FOLDER_KEY],
-            _genome_asset_path(
-                self[CFG_GENOMES_KEY],
+            _tag_asset_path(
+                asset_tag_data,
                 genome_name,
                 asset_name,
                 tag_name,
@@ -920,22 +1064,16 @@ class RefGenConf(yacman.YacAttMap):
                 no_tag=True,
             ),
         )
-        _LOGGER.debug(
-            "Trying path relative to genome_folder ({}): {}".format(
-                self[CFG_FOLDER_KEY], gf_relpath
-            )
-        )
+        _LOGGER.debug("Trying path relative to genome_folder: %s", gf_relpath)
         if check_exist(gf_relpath):
             return gf_relpath
-
+        tried.append(gf_relpath)
+        # return option2 if existence not enforced
+        if strict_exists is None and not _LOGGER.isEnabledFor(logging.DEBUG):
+            return fullpath
         msg = "For genome '{}' the asset '{}.{}:{}' doesn't exist; tried: {}".format(
-            genome_name,
-            asset_name,
-            seek_key,
-            tag_name,
-            ", ".join([path, gf_relpath, fullpath]),
+            genome_name, asset_name, seek_key, tag_name, ", ".join(tried)
         )
-        # return option2 if existence not enforced
         if strict_exists is None:
             _LOGGER.debug(msg)
         elif strict_exists is True:
@@ -958,7 +1096,7 @@ class RefGenConf(yacman.YacAttMap):
         :return str: name of the tag to use as the default one
         """
         try:
-            self._assert_gat_exists(genome, asset)
+            asset_mapping = self._assert_gat_exists(genome, asset)
         except RefgenconfError:
             _LOGGER.info(
                 "Using '{}' as the default tag for '{}/{}'".format(
@@ -967,18 +1105,19 @@ class RefGenConf(yacman.YacAttMap):
             )
             return DEFAULT_TAG
         try:
-            return self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset][
-                CFG_ASSET_DEFAULT_TAG_KEY
-            ]
+            return asset_mapping[CFG_ASSET_DEFAULT_TAG_KEY]
         except KeyError:
             alt = (
-                self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset][
-                    CFG_ASSET_TAGS_KEY
-                ].keys()[0]
+                next(iter(asset_mapping[CFG_ASSET_TAGS_KEY]), DEFAULT_TAG)
                 if use_existing
                 else DEFAULT_TAG
             )
             if isinstance(alt, str):
+                # warn just once per asset, the fallback is looked up over and over
+                warned = self._cache.setdefault(_WARNED_DEFAULT_TAGS, set())
+                if (genome, asset, alt) in warned:
+                    return alt
+                warned.add((genome, asset, alt))
                 if alt != DEFAULT_TAG:
                     warnings.warn(
                         "Could not find the '{}' key for asset '{}/{}'. "
@@ -998,9 +1137,7 @@ class RefGenConf(yacman.YacAttMap):
                     )
                 return alt
         except TypeError:
-            _raise_not_mapping(
-                self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset], "Asset section "
-            )
+            _raise_not_mapping(asset_mapping, "Asset section ")
 
     def set_default_pointer(
         self,
@@ -1078,17 +1215,15 @@ class RefGenConf(yacman.YacAttMap):
             collection of assembly names for which the asset key is available
             will be returned.
         """
-        return (
-            self._invert_genomes(order)
-            if not asset
-            else sorted(
-                [
-                    self.get_genome_alias(g, fallback=True)
-                    for g, data in self[CFG_GENOMES_KEY].items()
-                    if asset in data.get(CFG_ASSETS_KEY)
-                ],
-                key=order,
-            )
+        if not asset:
+            return self._invert_genomes(order)
+        return sorted(
+            (
+                self.get_genome_alias(g, fallback=True)
+                for g, data in self[CFG_GENOMES_KEY].items()
+                if asset in (data.get(CFG_ASSETS_KEY) or {})
+            ),
+            key=order,
         )
 
     def list_seek_keys_values(self, genomes=None, assets=None):
@@ -1106,31 +1241,44 @@ class RefGenConf(yacman.YacAttMap):
             genome_names = self.genomes_list()
         else:
             genome_names = _make_list_of_str(genomes)
+        if assets is None:
+            # list the assets of all the genomes at once, keyed by primary alias
+            assets_by_genome = self.list(genome=genome_names)
+        else:
+            asset_names = _make_list_of_str(assets)
+        alias_dir = self.alias_dir
 
         for genome_name in genome_names:
-            self._assert_gat_exists(genome_name)
+            genome_mapping = self._assert_gat_exists(genome_name)
+            # resolve the genome identity once, it's the same for all the paths
+            genome_digest = self.get_genome_alias_digest(genome_name, fallback=True)
+            genome_ids = _make_list_of_str(
+                self.get_genome_alias(genome_digest, fallback=True, all_aliases=True)
+            )
+            genome_id = genome_name if genome_name in genome_ids else genome_ids[0]
             ret[genome_name] = {}
             if assets is None:
-                asset_names = self.list_assets_by_genome(genome_name)
-            else:
-                asset_names = _make_list_of_str(assets)
+                asset_names = assets_by_genome.get(genome_ids[0], [])
             for asset_name in asset_names:
                 try:
-                    self._assert_gat_exists(genome_name, asset_name)
+                    asset_mapping = self._assert_gat_exists(genome_name, asset_name)
                 except MissingAssetError as e:
                     _LOGGER.warning(f"Skipping {asset_name} asset: {str(e)}")
                     continue
-                asset_mapping = self[CFG_GENOMES_KEY][genome_name][CFG_ASSETS_KEY][
-                    asset_name
-                ]
                 ret[genome_name][asset_name] = {}
-                for tag_name in get_asset_tags(asset_mapping):
-                    tag_mapping = asset_mapping[CFG_ASSET_TAGS_KEY][tag_name]
-                    ret[genome_name][asset_name][tag_name] = {}
-                    for seek_key_name in get_tag_seek_keys(tag_mapping):
-                        ret[genome_name][asset_name][tag_name][
-                            seek_key_name
-                        ] = self.seek(genome_name, asset_name, tag_name, seek_key_name)
+                for tag_name, tag_data in asset_mapping[CFG_ASSET_TAGS_KEY].items():
+                    seek_keys = tag_data.get(CFG_SEEK_KEYS_KEY, {})
+                    ret[genome_name][asset_name][tag_name] = {
+                        seek_key_name: _alias_asset_path(
+                            alias_dir,
+                            genome_digest,
+                            genome_id,
+                            asset_name,
+                            tag_name,
+                            seek_key_value,
+                        )
+                        for seek_key_name, seek_key_value in seek_keys.items()
+                    }
         return ret
 
     def get_local_data_str(self, genome=None, order=None):
@@ -1208,18 +1356,15 @@ class RefGenConf(yacman.YacAttMap):
 
             aliases_by_digest = send_data_request(aliases_url)
             # convert the original, condensed mapping to a data structure with optimal time complexity
-            digests_by_alias = {}
-            for k, v in aliases_by_digest.items():
-                for alias in v:
-                    digests_by_alias[alias] = k
+            digests_by_alias = {
+                alias: k for k, v in aliases_by_digest.items() for alias in v
+            }
 
             genome_digests = None
             genomes = genome if isinstance(genome, list) else [genome]
             if genome is not None:
                 genome_digests = [
-                    g
-                    if g in aliases_by_digest.keys()
-                    else digests_by_alias.get(g, None)
+                    g if g in aliases_by_digest else digests_by_alias.get(g, None)
                     for g in genomes
                 ]
                 if genome_digests is None:
@@ -1336,19 +1481,17 @@ class RefGenConf(yacman.YacAttMap):
                 f" you want to reassign. Currently defined tags "
                 f"for '{genome}/{asset}' are: {ts}"
             )
-        if new_tag in asset_mapping[CFG_ASSET_TAGS_KEY]:
+        tags_mapping = asset_mapping[CFG_ASSET_TAGS_KEY]
+        if new_tag in tags_mapping:
             if not force and not query_yes_no(
                 f"You already have a '{asset}' asset tagged as "
                 f"'{new_tag}', do you wish to override?"
             ):
                 _LOGGER.info("Tag action aborted by the user")
                 return
-        children = []
-        parents = []
-        if CFG_ASSET_CHILDREN_KEY in asset_mapping[CFG_ASSET_TAGS_KEY][tag]:
-            children = asset_mapping[CFG_ASSET_TAGS_KEY][tag][CFG_ASSET_CHILDREN_KEY]
-        if CFG_ASSET_PARENTS_KEY in asset_mapping[CFG_ASSET_TAGS_KEY][tag]:
-            parents = asset_mapping[CFG_ASSET_TAGS_KEY][tag][CFG_ASSET_PARENTS_KEY]
+        tag_mapping = tags_mapping[tag]
+        children = tag_mapping.get(CFG_ASSET_CHILDREN_KEY, [])
+        parents = tag_mapping.get(CFG_ASSET_PARENTS_KEY, [])
         if len(children) > 0 or len(parents) > 0:
             if not force and not query_yes_no(
                 f"The asset '{genome}/{asset}:{tag}' has {len(children)} "
@@ -1365,9 +1508,7 @@ class RefGenConf(yacman.YacAttMap):
             self._update_relatives_tags(
                 genome, asset, tag, new_tag, parents, update_children=True
             )
-        self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset][CFG_ASSET_TAGS_KEY][
-            new_tag
-        ] = asset_mapping[CFG_ASSET_TAGS_KEY][tag]
+        tags_mapping[new_tag] = tag_mapping
         if (
             CFG_ASSET_DEFAULT_TAG_KEY in asset_mapping
             and asset_mapping[CFG_ASSET_DEFAULT_TAG_KEY] == tag
@@ -1397,6 +1538,7 @@ class RefGenConf(yacman.YacAttMap):
         relative_key = (
             CFG_ASSET_CHILDREN_KEY if update_children else CFG_ASSET_PARENTS_KEY
         )
+        retagged_suffix = f"/{asset}:{new_tag}"
         for r in relatives:
             _LOGGER.debug(
                 "updating {} in '{}'".format(
@@ -1404,11 +1546,10 @@ class RefGenConf(yacman.YacAttMap):
                 )
             )
             r_data = prp(r)
-            try:
-                self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][r_data["item"]][
-                    CFG_ASSET_TAGS_KEY
-                ][r_data["tag"]]
-            except KeyError:
+            tag_entry = _get_tag_data(
+                self[CFG_GENOMES_KEY], genome, r_data["item"], r_data["tag"]
+            )
+            if tag_entry is None:
                 _LOGGER.warning(
                     "The {} asset of '{}/{}' does not exist: {}".format(
                         "parent" if update_children else "child", genome, asset, r
@@ -1416,37 +1557,18 @@ class RefGenConf(yacman.YacAttMap):
                 )
                 continue
             updated_relatives = []
-            if (
-                relative_key
-                in self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][r_data["item"]][
-                    CFG_ASSET_TAGS_KEY
-                ][r_data["tag"]]
-            ):
-                relatives = self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][
-                    r_data["item"]
-                ][CFG_ASSET_TAGS_KEY][r_data["tag"]][relative_key]
-                for relative in relatives:
+            if relative_key in tag_entry:
+                for relative in tag_entry[relative_key]:
                     ori_relative_data = prp(relative)
-                    ori_relative_data["namespace"] = self.get_genome_alias_digest(
+                    namespace = self.get_genome_alias_digest(
                         alias=ori_relative_data["namespace"], fallback=True
                     )
-                    if (
-                        ori_relative_data["item"] == asset
-                        and ori_relative_data["tag"] == tag
-                    ):
-                        ori_relative_data["tag"] = new_tag
-                        updated_relatives.append(
-                            "{}/{}:{}".format(
-                                ori_relative_data["namespace"], asset, new_tag
-                            )
-                        )
+                    item = ori_relative_data["item"]
+                    if item == asset and ori_relative_data["tag"] == tag:
+                        updated_relatives.append(namespace + retagged_suffix)
                     else:
                         updated_relatives.append(
-                            "{}/{}:{}".format(
-                                ori_relative_data["namespace"],
-                                ori_relative_data["item"],
-                                ori_relative_data["tag"],
-                            )
+                            f"{namespace}/{item}:{ori_relative_data['tag']}"
                         )
             self.update_relatives_assets(
                 genome,
@@ -1455,9 +1577,7 @@ class RefGenConf(yacman.YacAttMap):
                 updated_relatives,
                 update_children,
             )
-            self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][r_data["item"]][
-                CFG_ASSET_TAGS_KEY
-            ][r_data["tag"]][relative_key] = updated_relatives
+            tag_entry[relative_key] = updated_relatives
 
     def pull(
         self,
@@ -1523,190 +1643,226 @@ class RefGenConf(yacman.YacAttMap):
             _LOGGER.error("You are not subscribed to any asset servers")
             return _null_return()
 
-        good_servers = [
-            s for s in self[CFG_SERVERS_KEY] if get_json_url(s, API_ID_DIGEST)
-        ]
+        # the servers are checked again only if the subscribed ones change
+        servers_key = (_COMPATIBLE_SERVERS, get_json_url, tuple(self[CFG_SERVERS_KEY]))
+        try:
+            good_servers = self._cache[servers_key]
+        except KeyError:
+            good_servers = [
+                s for s in self[CFG_SERVERS_KEY] if get_json_url(s, API_ID_DIGEST)
+            ]
+            self._cache[servers_key] = good_servers
 
         _LOGGER.info(f"Compatible refgenieserver instances: {good_servers}")
 
-        for server_url in good_servers:
-            try:
-                genome = self.get_genome_alias_digest(alias=alias)
-            except yacman.UndefinedAliasError:
-                _LOGGER.info(f"No local digest for genome alias: {genome}")
-                if not self.set_genome_alias(
-                    genome=alias, servers=[server_url], create_genome=True
-                ):
-                    continue
-                genome = self.get_genome_alias_digest(alias=alias)
+        # the digest is resolved once; only the alias setting below can change it
+        try:
+            genome = self.get_genome_alias_digest(alias=alias)
+        except yacman.UndefinedAliasError:
+            genome = None
+        # if the digest is known, probe all the servers for the asset at once;
+        # the results are still considered in the order of the servers
+        executor = None
+        probes = {}
+        genome_attrs = None
+        if genome is not None and len(good_servers) > 1:
+            executor = ThreadPoolExecutor(max_workers=len(good_servers))
+            probes = {
+                s: executor.submit(
+                    _probe_asset_server, s, get_json_url, genome, asset, tag
+                )
+                for s in good_servers
+            }
+        try:
+            for server_url in good_servers:
+                if genome is None:
+                    _LOGGER.info(f"No local digest for genome alias: {alias}")
+                    if not self.set_genome_alias(
+                        genome=alias, servers=[server_url], create_genome=True
+                    ):
+                        continue
+                    genome = self.get_genome_alias_digest(alias=alias)
 
-            num_servers += 1
-            try:
-                determined_tag = (
-                    send_data_request(
-                        get_json_url(server_url, API_ID_DEFAULT_TAG).format(
-                            genome=genome, asset=asset
+                num_servers += 1
+                try:
+                    if server_url in probes:
+                        # consumed probes are dropped, the rest is cancelled
+                        determined_tag, archive_data = probes.pop(server_url).result()
+                    else:
+                        determined_tag, archive_data = _probe_asset_server(
+                            server_url, get_json_url, genome, asset, tag
                         )
+                except DownloadJsonError as e:
+                    _LOGGER.warning(
+                        f"Could not retrieve tag from: {server_url}. "
+                        f"Caught exception: {e}"
                     )
-                    if tag is None
-                    else tag
-                )
-            except DownloadJsonError as e:
-                _LOGGER.warning(
-                    f"Could not retrieve tag from: {server_url}. Caught exception: {e}"
-                )
-                bad_servers.append(server_url)
-                continue
-            else:
-                determined_tag = str(determined_tag)
+                    bad_servers.append(server_url)
+                    continue
                 _LOGGER.debug(f"Determined tag: {determined_tag}")
                 unpack or _raise_unpack_error()
-            gat = [genome, asset, determined_tag]
-            url_asset_attrs = get_json_url(server_url, API_ID_ASSET_ATTRS).format(
-                genome=genome, asset=asset
-            )
-            url_genome_attrs = get_json_url(server_url, API_ID_GENOME_ATTRS).format(
-                genome=genome
-            )
-            url_archive = get_json_url(server_url, API_ID_ARCHIVE).format(
-                genome=genome, asset=asset
-            )
-
-            try:
-                archive_data = send_data_request(
-                    url_asset_attrs, params={"tag": determined_tag}
-                )
-            except DownloadJsonError:
-                no_asset_json.append(server_url)
-                if num_servers == len(good_servers):
-                    _LOGGER.error(
-                        f"'{genome}/{asset}:{determined_tag}' not "
-                        f"available on any of the following servers: "
-                        f"{', '.join(self[CFG_SERVERS_KEY])}"
-                    )
-                    return _null_return()
-                continue
-            else:
+                gat = [genome, asset, determined_tag]
+                if isinstance(archive_data, DownloadJsonError):
+                    no_asset_json.append(server_url)
+                    if num_servers == len(good_servers):
+                        _LOGGER.error(
+                            f"'{genome}/{asset}:{determined_tag}' not "
+                            f"available on any of the following servers: "
+                            f"{', '.join(self[CFG_SERVERS_KEY])}"
+                        )
+                        return _null_return()
+                    continue
                 _LOGGER.debug("Determined server URL: {}".format(server_url))
-                genome_archive_data = send_data_request(url_genome_attrs)
+                # the genome attributes are only needed from the server that
+                # the asset is pulled from; they are fetched during the download
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=1)
+                url_genome_attrs = get_json_url(server_url, API_ID_GENOME_ATTRS).format(
+                    genome=genome
+                )
+                genome_attrs = executor.submit(send_data_request, url_genome_attrs)
+                url_archive = get_json_url(server_url, API_ID_ARCHIVE).format(
+                    genome=genome, asset=asset
+                )
 
-            if sys.version_info[0] == 2:
-                archive_data = asciify_json_dict(archive_data)
+                if sys.version_info[0] == 2:
+                    archive_data = asciify_json_dict(archive_data)
 
-            # local directory that the asset data will be stored in
-            tag_dir = os.path.dirname(self.filepath(*gat))
-            # local target path for the saved archive
-            tardir = os.path.join(self.data_dir, genome, asset)
-            tarpath = os.path.join(tardir, asset + "__" + determined_tag + ".tgz")
-            # check if the genome/asset:tag exists and get request user decision
-            if os.path.exists(tag_dir):
+                # local target path for the saved archive
+                tardir = os.path.join(self.data_dir, genome, asset)
+                # local directory that the asset data will be stored in
+                tag_dir = os.path.join(tardir, determined_tag)
+                tarpath = os.path.join(tardir, asset + "__" + determined_tag + ".tgz")
+                # check if the genome/asset:tag exists and get request user decision
+                if os.path.exists(tag_dir):
 
-                def preserve():
-                    _LOGGER.info(f"Preserving existing: {tag_dir}")
-                    return _null_return()
+                    def preserve():
+                        _LOGGER.info(f"Preserving existing: {tag_dir}")
+                        return _null_return()
 
-                if force is False:
-                    return preserve()
-                elif force is None:
-                    if not query_yes_no(f"Replace existing ({tag_dir})?", "no"):
+                    if force is False:
                         return preserve()
+                    elif force is None:
+                        if not query_yes_no(f"Replace existing ({tag_dir})?", "no"):
+                            return preserve()
+                        else:
+                            _LOGGER.debug(f"Overwriting: {tag_dir}")
                     else:
                         _LOGGER.debug(f"Overwriting: {tag_dir}")
-                else:
-                    _LOGGER.debug(f"Overwriting: {tag_dir}")
 
-            # check asset digests local-server match for each parent
-            [
-                self._chk_digest_if_avail(
-                    genome, x, archive_data[CFG_ASSET_CHECKSUM_KEY]
+                # check asset digests local-server match for each parent
+                parents = archive_data.get(CFG_ASSET_PARENTS_KEY, [])
+                if parents:
+                    server_checksum = archive_data[CFG_ASSET_CHECKSUM_KEY]
+                    for x in parents:
+                        self._chk_digest_if_avail(genome, x, server_checksum)
+
+                bundle_name = "{}/{}:{}".format(*gat)
+                archsize = archive_data[CFG_ARCHIVE_SIZE_KEY]
+                _LOGGER.debug(f"'{bundle_name}' archive size: {archsize}")
+
+                if not force_large and _is_large_archive(archsize, size_cutoff):
+                    if force_large is False:
+                        _LOGGER.info(
+                            "Skipping pull of {}/{}:{}; size: {}".format(*gat, archsize)
+                        )
+                        return _null_return()
+                    if not query_yes_no(
+                        "This archive exceeds the size cutoff ({} > {:.1f}GB). "
+                        "Do you want to proceed?".format(archsize, size_cutoff)
+                    ):
+                        _LOGGER.info(
+                            "Skipping pull of {}/{}:{}; size: {}".format(*gat, archsize)
+                        )
+                        return _null_return()
+
+                os.makedirs(tardir, exist_ok=True)
+
+                # Download the file from `url` and save it locally under `filepath`:
+                _LOGGER.info(f"Downloading URL: {url_archive}")
+                download = partial(
+                    _download_url_progress,
+                    url_archive,
+                    tarpath,
+                    bundle_name,
+                    params={"tag": determined_tag},
                 )
-                for x in archive_data[CFG_ASSET_PARENTS_KEY]
-                if CFG_ASSET_PARENTS_KEY in archive_data
-            ]
-
-            bundle_name = "{}/{}:{}".format(*gat)
-            archsize = archive_data[CFG_ARCHIVE_SIZE_KEY]
-            _LOGGER.debug(f"'{bundle_name}' archive size: {archsize}")
-
-            if not force_large and _is_large_archive(archsize, size_cutoff):
-                if force_large is False:
-                    _LOGGER.info(
-                        "Skipping pull of {}/{}:{}; size: {}".format(*gat, archsize)
+                archive_hash = md5()
+                try:
+                    signal.signal(signal.SIGINT, build_signal_handler(tarpath))
+                    try:
+                        download(hasher=archive_hash)
+                    except ContentTooShortError as e:
+                        # continue once from where the incomplete download stopped
+                        _LOGGER.warning(f"{e}; resuming download: {tarpath}")
+                        archive_hash = md5()
+                        download(hasher=archive_hash, resume=True)
+                except HTTPError:
+                    _LOGGER.error(
+                        "Asset archive '{}/{}:{}' is missing on the "
+                        "server: {s}".format(*gat, s=server_url)
                     )
-                    return _null_return()
-                if not query_yes_no(
-                    "This archive exceeds the size cutoff ({} > {:.1f}GB). "
-                    "Do you want to proceed?".format(archsize, size_cutoff)
-                ):
-                    _LOGGER.info(
-                        "Skipping pull of {}/{}:{}; size: {}".format(*gat, archsize)
+                    if server_url == self[CFG_SERVERS_KEY][-1]:
+                        # it this was the last server on the list, return
+                        return _null_return()
+                    else:
+                        _LOGGER.info("Trying next server")
+                        # set the tag value back to what user requested
+                        determined_tag = tag
+                        continue
+                except (ConnectionRefusedError, ConnectionError) as e:
+                    _LOGGER.error(str(e))
+                    _LOGGER.error(
+                        f"Server {server_url}/{API_VERSION} refused "
+                        f"download. Check your internet settings"
                     )
                     return _null_return()
+                except ContentTooShortError as e:
+                    _LOGGER.error(str(e))
+                    _LOGGER.error(f"'{bundle_name}' download incomplete")
+                    return _null_return()
+                else:
+                    _LOGGER.info(f"Download complete: {tarpath}")
 
-            if not os.path.exists(tardir):
-                _LOGGER.debug(f"Creating directory: {tardir}")
-                os.makedirs(tardir)
-
-            # Download the file from `url` and save it locally under `filepath`:
-            _LOGGER.info(f"Downloading URL: {url_archive}")
-            try:
-                signal.signal(signal.SIGINT, build_signal_handler(tarpath))
-                _download_url_progress(
-                    url_archive, tarpath, bundle_name, params={"tag": determined_tag}
+                new_checksum = archive_hash.hexdigest()
+                old_checksum = archive_data and archive_data.get(
+                    CFG_ARCHIVE_CHECKSUM_KEY
                 )
-            except HTTPError:
-                _LOGGER.error(
-                    "Asset archive '{}/{}:{}' is missing on the "
-                    "server: {s}".format(*gat, s=server_url)
-                )
-                if server_url == self[CFG_SERVERS_KEY][-1]:
-                    # it this was the last server on the list, return
+                if old_checksum and new_checksum != old_checksum:
+                    _LOGGER.error(
+                        f"Downloaded archive ('{tarpath}') checksum "
+                        f"mismatch: ({new_checksum}, {old_checksum})"
+                    )
                     return _null_return()
                 else:
-                    _LOGGER.info("Trying next server")
-                    # set the tag value back to what user requested
-                    determined_tag = tag
-                    continue
-            except ConnectionRefusedError as e:
-                _LOGGER.error(str(e))
-                _LOGGER.error(
-                    f"Server {server_url}/{API_VERSION} refused "
-                    f"download. Check your internet settings"
-                )
-                return _null_return()
-            except ContentTooShortError as e:
-                _LOGGER.error(str(e))
-                _LOGGER.error(f"'{bundle_name}' download incomplete")
-                return _null_return()
-            else:
-                _LOGGER.info(f"Download complete: {tarpath}")
-
-            new_checksum = checksum(tarpath)
-            old_checksum = archive_data and archive_data.get(CFG_ARCHIVE_CHECKSUM_KEY)
-            if old_checksum and new_checksum != old_checksum:
-                _LOGGER.error(
-                    f"Downloaded archive ('{tarpath}') checksum "
-                    f"mismatch: ({new_checksum}, {old_checksum})"
-                )
-                return _null_return()
-            else:
-                _LOGGER.debug(f"Matched checksum: '{old_checksum}'")
-            # successfully downloaded tarball; untar it
-            if unpack and tarpath.endswith(".tgz"):
-                _LOGGER.info(f"Extracting asset tarball: {tarpath}")
-                untar(tarpath, tardir)
-                os.remove(tarpath)
-
-            if self.file_path:
-                with self as rgc:
-                    [
-                        rgc.chk_digest_update_child(
-                            gat[0], x, "{}/{}:{}".format(*gat), server_url
+                    _LOGGER.debug(f"Matched checksum: '{old_checksum}'")
+                # successfully downloaded tarball; untar it
+                if unpack and tarpath.endswith(".tgz"):
+                    _LOGGER.info(f"Extracting asset tarball: {tarpath}")
+                    untar(tarpath, tardir)
+                    os.remove(tarpath)
+
+                genome_archive_data = genome_attrs.result()
+                if self.file_path:
+                    with self as rgc:
+                        for x in parents:
+                            rgc.chk_digest_update_child(
+                                gat[0], x, bundle_name, server_url
+                            )
+                        rgc.update_tags(
+                            *gat,
+                            data={
+                                attr: archive_data[attr]
+                                for attr in ATTRS_COPY_PULL
+                                if attr in archive_data
+                            },
                         )
-                        for x in archive_data[CFG_ASSET_PARENTS_KEY]
-                        if CFG_ASSET_PARENTS_KEY in archive_data
-                    ]
-                    rgc.update_tags(
+                        rgc.set_default_pointer(*gat)
+                        rgc.update_genomes(genome=genome, data=genome_archive_data)
+                else:
+                    for x in parents:
+                        self.chk_digest_update_child(gat[0], x, bundle_name, server_url)
+                    self.update_tags(
                         *gat,
                         data={
                             attr: archive_data[attr]
@@ -1714,33 +1870,24 @@ class RefGenConf(yacman.YacAttMap):
                             if attr in archive_data
                         },
                     )
-                    rgc.set_default_pointer(*gat)
-                    rgc.update_genomes(genome=genome, data=genome_archive_data)
-            else:
-                [
-                    self.chk_digest_update_child(
-                        gat[0], x, "{}/{}:{}".format(*gat), server_url
+                    self.set_default_pointer(*gat)
+                    self.update_genomes(genome=genome, data=genome_archive_data)
+                if asset == "fasta":
+                    self.initialize_genome(
+                        fasta_path=self.seek_src(*gat), alias=alias, fasta_unzipped=True
                     )
-                    for x in archive_data[CFG_ASSET_PARENTS_KEY]
-                    if CFG_ASSET_PARENTS_KEY in archive_data
-                ]
-                self.update_tags(
-                    *gat,
-                    data={
-                        attr: archive_data[attr]
-                        for attr in ATTRS_COPY_PULL
-                        if attr in archive_data
-                    },
-                )
-                self.set_default_pointer(*gat)
-                self.update_genomes(genome=genome, data=genome_archive_data)
-            if asset == "fasta":
-                self.initialize_genome(
-                    fasta_path=self.seek_src(*gat), alias=alias, fasta_unzipped=True
-                )
-            self.run_plugins(POST_PULL_HOOK)
-            self._symlink_alias(*gat)
-            return gat, archive_data, server_url
+                self.run_plugins(POST_PULL_HOOK)
+                self._symlink_alias(*gat)
+                return gat, archive_data, server_url
+        finally:
+            if executor is not None:
+                # the probes of the servers that were not reached are not needed;
+                # the running ones are waited for, so none outlive the pull
+                for probe in probes.values():
+                    probe.cancel()
+                if genome_attrs is not None:
+                    genome_attrs.cancel()
+                executor.shutdown(wait=True)
 
     def get_genome_alias_digest(self, alias, fallback=False):
         """
@@ -1753,14 +1900,12 @@ class RefGenConf(yacman.YacAttMap):
         :raise UndefinedAliasError: if the specified alias has been assigned to
             any digests
         """
-        try:
-            return self[CFG_GENOMES_KEY].get_key(alias=alias)
-        except (yacman.UndefinedAliasError, AttributeError):
-            if not fallback:
-                raise
-            if alias in self.genome_aliases.values():
-                return alias
-            raise
+        digests_by_alias = self._genome_digests_by_alias()
+        if alias in digests_by_alias:
+            return digests_by_alias[alias]
+        if fallback and alias in self._genome_aliases_by_digest():
+            return alias
+        raise yacman.UndefinedAliasError(f"No key defined for: {alias}")
 
     def get_genome_alias(self, digest, fallback=False, all_aliases=False):
         """
@@ -1777,15 +1922,79 @@ class RefGenConf(yacman.YacAttMap):
         :raise UndefinedAliasError: if a no alias has been defined for the
             requested digest
         """
+        aliases_by_digest = self._genome_aliases_by_digest()
+        if digest in aliases_by_digest:
+            res = aliases_by_digest[digest]
+            return list(res) if all_aliases else res[0]
+        if fallback and digest in self.genome_aliases:
+            return digest
+        raise yacman.UndefinedAliasError(f"No alias defined for: {digest}")
+
+    def _get_genome_aliases(self, digests):
+        """
+        Get the human readable alias for each of the genome digests
+
+        Equivalent to calling get_genome_alias with fallback for every digest.
+
+        :param Iterable[str] digests: digests to find human-readable aliases for
+        :return list[str]: human-readable aliases, one per digest
+        :raise UndefinedAliasError: if a no alias has been defined for any of
+            the requested digests
+        """
+        return [self.get_genome_alias(d, fallback=True) for d in digests]
+
+    def _genome_aliases_by_digest(self):
+        """
+        Get the genome aliases keyed by the genome digests
+
+        The aliases mapping is inverted once and cached until the aliases
+        are changed.
+
+        :return dict[str, list[str]]: aliases of the genomes, in the order
+            they were defined in
+        """
         try:
-            res = self[CFG_GENOMES_KEY].get_aliases(key=digest)
-            return res if all_aliases else res[0]
-        except (yacman.UndefinedAliasError, AttributeError):
-            if not fallback:
-                raise
-            if digest in self.genome_aliases.keys():
-                return digest
-            raise
+            return self._cache[_ALIASES_BY_DIGEST]
+        except KeyError:
+            aliases_by_digest = {}
+            for alias, digest in self.genome_aliases.items():
+                aliases_by_digest.setdefault(digest, []).append(alias)
+            self._cache[_ALIASES_BY_DIGEST] = aliases_by_digest
+            return aliases_by_digest
+
+    def _genome_digests_by_alias(self):
+        """
+        Get the genome digests keyed by the genome aliases
+
+        The aliases mapping is copied once and cached until the aliases
+        are changed, so that the lookups skip the path expansion of the
+        config mapping.
+
+        :return dict[str, str]: digests of the genomes by their aliases
+        """
+        try:
+            return self._cache[_DIGESTS_BY_ALIAS]
+        except KeyError:
+            digests_by_alias = dict(self.genome_aliases.items())
+            self._cache[_DIGESTS_BY_ALIAS] = digests_by_alias
+            return digests_by_alias
+
+    def _clear_aliases_cache(self):
+        """
+        Forget the cached genome aliases mappings, after the aliases change
+        """
+        self._cache.pop(_ALIASES_BY_DIGEST, None)
+        self._cache.pop(_DIGESTS_BY_ALIAS, None)
+
+    def _forget_genome_aliases(self, digest):
+        """
+        Forget the aliases of a genome, after its config entry is deleted
+
+        :param str digest: digest of the deleted genome
+        """
+        if self[CFG_GENOMES_KEY] is not None:
+            self[CFG_GENOMES_KEY].remove_aliases(key=digest)
+        self._clear_aliases_cache()
 
     def remove_genome_aliases(self, digest, aliases=None):
         """
@@ -1806,6 +2015,7 @@ class RefGenConf(yacman.YacAttMap):
             """
             if rgc[CFG_GENOMES_KEY]:
                 rmd = rgc[CFG_GENOMES_KEY].remove_aliases(key=d, aliases=a)
+                rgc._clear_aliases_cache()
                 if not rmd:
                     return rmd
                 try:
@@ -1872,6 +2082,7 @@ class RefGenConf(yacman.YacAttMap):
             sa, ra = rgc[CFG_GENOMES_KEY].set_aliases(
                 aliases=a, key=d, overwrite=overwrite, reset_key=reset_digest
             )
+            rgc._clear_aliases_cache()
             try:
                 rgc[CFG_GENOMES_KEY][d][CFG_ALIASES_KEY] = rgc[
                     CFG_GENOMES_KEY
@@ -1949,15 +2160,31 @@ class RefGenConf(yacman.YacAttMap):
                 "Can't initialize genome; FASTA file does "
                 "not exist: {}".format(fasta_path)
             )
-        ssc = SeqColClient({})
-        d, _ = ssc.load_fasta(fasta_path, gzipped=not fasta_unzipped)
-        # retrieve annotated sequence digests list to save in a JSON file
-        asdl = ssc.retrieve(druid=d)
-        pth = self.get_asds_path(d)
-        os.makedirs(os.path.dirname(pth), exist_ok=True)
-        with open(pth, "w") as jfp:
-            json.dump(asdl, jfp)
-        _LOGGER.debug("Saved ASDs to JSON: {}".format(pth))
+        # the FASTA file may be replaced, so none of the open ones is reused
+        self.close_fastas()
+        fasta_stat = os.stat(fasta_path)
+        fasta_id = [fasta_stat.st_mtime_ns, fasta_stat.st_size]
+        fasta_key = os.path.realpath(fasta_path)
+        digests_path = os.path.join(self.data_dir, _FASTA_DIGESTS_FILE)
+        fasta_digests = _read_json_file(digests_path) or {}
+        asdl = None
+        cached = fasta_digests.get(fasta_key)
+        if cached is not None and cached[:2] == fasta_id:
+            d = cached[2]
+            asdl = _read_json_file(self.get_asds_path(d))
+            if asdl is not None:
+                _LOGGER.debug("Using the digest of unchanged FASTA: %s", d)
+        if asdl is None:
+            ssc = SeqColClient({})
+            d, _ = ssc.load_fasta(fasta_path, gzipped=not fasta_unzipped)
+            # retrieve annotated sequence digests list to save in a JSON file
+            asdl = ssc.retrieve(druid=d)
+            pth = self.get_asds_path(d)
+            os.makedirs(os.path.dirname(pth), exist_ok=True)
+            with open(pth, "w") as jfp:
+                json.dump(asdl, jfp)
+            _LOGGER.debug("Saved ASDs to JSON: %s", pth)
+            _update_json_file(digests_path, fasta_key, fasta_id + [d])
         self.set_genome_alias(
             genome=alias,
             digest=d,
@@ -2001,15 +2228,16 @@ class RefGenConf(yacman.YacAttMap):
                 continue
             for rel in tag_data[rel_type]:
                 parsed = prp(rel)
-                _LOGGER.debug("Removing '{}' from '{}' {}".format(to_remove, rel, tmp))
-                try:
-                    self[CFG_GENOMES_KEY][parsed["namespace"] or genome][
-                        CFG_ASSETS_KEY
-                    ][parsed["item"]][CFG_ASSET_TAGS_KEY][parsed["tag"]][tmp].remove(
-                        to_remove
-                    )
-                except (KeyError, ValueError):
-                    pass
+                _LOGGER.debug("Removing '%s' from '%s' %s", to_remove, rel, tmp)
+                rel_tag_data = _get_tag_data(
+                    self[CFG_GENOMES_KEY],
+                    parsed["namespace"] or genome,
+                    parsed["item"],
+                    parsed["tag"],
+                )
+                rel_relatives = (rel_tag_data or {}).get(tmp)
+                if rel_relatives and to_remove in rel_relatives:
+                    rel_relatives.remove(to_remove)
 
     def update_relatives_assets(
         self, genome, asset, tag=None, data=None, children=False
@@ -2057,8 +2285,9 @@ class RefGenConf(yacman.YacAttMap):
         if _check_insert_data(keys, Mapping, "keys"):
             self.update_tags(genome, asset, tag, force_digest=force_digest)
             asset = self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset]
-            _safe_setdef(asset[CFG_ASSET_TAGS_KEY][tag], CFG_SEEK_KEYS_KEY, PXAM())
-            asset[CFG_ASSET_TAGS_KEY][tag][CFG_SEEK_KEYS_KEY].update(keys)
+            _safe_setdef(
+                asset[CFG_ASSET_TAGS_KEY][tag], CFG_SEEK_KEYS_KEY, PXAM()
+            ).update(keys)
         return self
 
     def update_tags(self, genome, asset=None, tag=None, data=None, force_digest=None):
@@ -2078,29 +2307,17 @@ class RefGenConf(yacman.YacAttMap):
             genome = force_digest or self.get_genome_alias_digest(
                 alias=genome, fallback=True
             )
-            _safe_setdef(self[CFG_GENOMES_KEY], genome, PXAM())
+            genome_mapping = _safe_setdef(self[CFG_GENOMES_KEY], genome, PXAM())
             if _check_insert_data(asset, str, "asset"):
-                _safe_setdef(self[CFG_GENOMES_KEY][genome], CFG_ASSETS_KEY, PXAM())
-                _safe_setdef(
-                    self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY], asset, PXAM()
-                )
+                assets_mapping = _safe_setdef(genome_mapping, CFG_ASSETS_KEY, PXAM())
+                asset_mapping = _safe_setdef(assets_mapping, asset, PXAM())
                 if _check_insert_data(tag, str, "tag"):
-                    _safe_setdef(
-                        self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset],
-                        CFG_ASSET_TAGS_KEY,
-                        PXAM(),
-                    )
-                    _safe_setdef(
-                        self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset][
-                            CFG_ASSET_TAGS_KEY
-                        ],
-                        tag,
-                        PXAM(),
+                    tags_mapping = _safe_setdef(
+                        asset_mapping, CFG_ASSET_TAGS_KEY, PXAM()
                     )
+                    tag_mapping = _safe_setdef(tags_mapping, tag, PXAM())
                     if _check_insert_data(data, Mapping, "data"):
-                        self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset][
-                            CFG_ASSET_TAGS_KEY
-                        ][tag].update(data)
+                        tag_mapping.update(data)
         return self
 
     def update_assets(self, genome, asset=None, data=None, force_digest=None):
@@ -2119,14 +2336,12 @@ class RefGenConf(yacman.YacAttMap):
             genome = force_digest or self.get_genome_alias_digest(
                 alias=genome, fallback=True
             )
-            _safe_setdef(self[CFG_GENOMES_KEY], genome, PXAM())
+            genome_mapping = _safe_setdef(self[CFG_GENOMES_KEY], genome, PXAM())
             if _check_insert_data(asset, str, "asset"):
-                _safe_setdef(self[CFG_GENOMES_KEY][genome], CFG_ASSETS_KEY, PXAM())
-                _safe_setdef(
-                    self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY], asset, PXAM()
-                )
+                assets_mapping = _safe_setdef(genome_mapping, CFG_ASSETS_KEY, PXAM())
+                asset_mapping = _safe_setdef(assets_mapping, asset, PXAM())
                 if _check_insert_data(data, Mapping, "data"):
-                    self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset].update(data)
+                    asset_mapping.update(data)
         return self
 
     def remove(
@@ -2158,24 +2373,30 @@ class RefGenConf(yacman.YacAttMap):
                 "asset": asset,
                 "tag": tag,
             }
-            _LOGGER.debug("Attempting removal: {}".format(req_dict))
+            _LOGGER.debug("Attempting removal: %s", req_dict)
             if not force and not query_yes_no(
                 "Remove '{}/{}:{}'?".format(genome, asset, tag)
             ):
                 _LOGGER.info("Action aborted by the user")
                 return
+            if asset == "fasta":
+                # getseq must not keep reading the removed file
+                self.close_fastas()
             removed = []
             asset_path = self.seek_src(
                 genome, asset, tag, enclosing_dir=True, strict_exists=False
             )
-            alias_asset_paths = self.seek(
-                genome,
-                asset,
-                tag,
-                enclosing_dir=True,
-                strict_exists=False,
-                all_aliases=True,
+            # the tag was just found by seek_src, so the alias directories are
+            # built from the digest without seeking the same asset again
+            genome_digest = req_dict["genome"]
+            alias_dir = self.alias_dir
+            genome_ids = _make_list_of_str(
+                self.get_genome_alias(genome_digest, fallback=True, all_aliases=True)
             )
+            alias_asset_paths = [
+                _alias_asset_path(alias_dir, genome_digest, gid, asset, tag, "")
+                for gid in genome_ids
+            ]
             if os.path.exists(asset_path):
                 removed.append(_remove(asset_path))
                 removed.extend([_remove(p) for p in alias_asset_paths])
@@ -2199,36 +2420,36 @@ class RefGenConf(yacman.YacAttMap):
             try:
                 self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset]
             except (KeyError, TypeError):
-                asset_dir = os.path.abspath(os.path.join(asset_path, os.path.pardir))
-                alias_asset_dirs = [
-                    os.path.abspath(os.path.join(p, os.path.pardir))
-                    for p in alias_asset_paths
-                ]
+                # the paths are absolute and built under the genome folder,
+                # so the parent directories are a matter of string splitting
+                asset_dir = os.path.dirname(asset_path)
+                alias_asset_dirs = [os.path.dirname(p) for p in alias_asset_paths]
                 _entity_dir_removal_log(asset_dir, "asset", req_dict, removed)
                 removed.extend([_remove(p) for p in alias_asset_dirs])
                 try:
                     self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY]
                 except (KeyError, TypeError):
-                    genome_dir = os.path.abspath(
-                        os.path.join(asset_dir, os.path.pardir)
-                    )
-                    alias_genome_dirs = [
-                        os.path.abspath(os.path.join(p, os.path.pardir))
-                        for p in alias_asset_dirs
-                    ]
+                    genome_dir = os.path.dirname(asset_dir)
+                    alias_genome_dirs = [os.path.dirname(p) for p in alias_asset_dirs]
                     _entity_dir_removal_log(genome_dir, "genome", req_dict, removed)
                     removed.extend([_remove(p) for p in alias_genome_dirs])
+                    # the genome is usually gone with its last asset already;
+                    # check first, so the file is not written again for nothing
                     try:
+                        self[CFG_GENOMES_KEY][genome]
+                    except (KeyError, TypeError):
+                        _LOGGER.debug(
+                            "Could not remove genome '%s' from the config; it "
+                            "does not exist",
+                            genome,
+                        )
+                    else:
                         if self.file_path:
                             with self as r:
                                 del r[CFG_GENOMES_KEY][genome]
                         else:
                             del self[CFG_GENOMES_KEY][genome]
-                    except (KeyError, TypeError):
-                        _LOGGER.debug(
-                            "Could not remove genome '{}' from the config; it "
-                            "does not exist".format(genome)
-                        )
+                        self._forget_genome_aliases(genome_digest)
             _LOGGER.info(f"Successfully removed entities:{block_iter_repr(removed)}")
         else:
             if self.file_path:
@@ -2266,12 +2487,12 @@ class RefGenConf(yacman.YacAttMap):
             :param list[Mapping, str] alt: a list of length 2 that indicates alternative
             Mapping-attribute combination to remove
             """
+            # membership and item access resolve aliases, unlike get/pop
             if attr in obj and len(obj[attr]) == 0:
                 if alt is None:
                     del obj[attr]
-                else:
-                    if alt[1] in alt[0]:
-                        del alt[0][alt[1]]
+                elif alt[1] in alt[0]:
+                    del alt[0][alt[1]]
 
         tag = tag or self.get_default_tag(genome, asset)
         if _check_insert_data(genome, str, "genome"):
@@ -2279,33 +2500,25 @@ class RefGenConf(yacman.YacAttMap):
                 if _check_insert_data(tag, str, "tag"):
                     if relationships:
                         self.remove_asset_from_relatives(genome, asset, tag)
-                    del self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset][
-                        CFG_ASSET_TAGS_KEY
-                    ][tag]
-                    _del_if_empty(
-                        self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset],
-                        CFG_ASSET_TAGS_KEY,
-                        [self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY], asset],
-                    )
-                    _del_if_empty(self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY], asset)
+                    genomes = self[CFG_GENOMES_KEY]
+                    genome_mapping = genomes[genome]
+                    assets_mapping = genome_mapping[CFG_ASSETS_KEY]
+                    asset_mapping = assets_mapping[asset]
+                    del asset_mapping[CFG_ASSET_TAGS_KEY][tag]
                     _del_if_empty(
-                        self[CFG_GENOMES_KEY][genome],
-                        CFG_ASSETS_KEY,
-                        [self[CFG_GENOMES_KEY], genome],
+                        asset_mapping, CFG_ASSET_TAGS_KEY, [assets_mapping, asset]
                     )
-                    _del_if_empty(self[CFG_GENOMES_KEY], genome)
-                    try:
-                        default_tag = self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][
-                            asset
-                        ][CFG_ASSET_DEFAULT_TAG_KEY]
-                    except KeyError:
-                        pass
-                    else:
-                        if default_tag == tag:
-                            del self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset][
-                                CFG_ASSET_DEFAULT_TAG_KEY
-                            ]
-                    if len(self[CFG_GENOMES_KEY]) == 0:
+                    _del_if_empty(assets_mapping, asset)
+                    n_genomes = len(genomes)
+                    digest = self.get_genome_alias_digest(alias=genome, fallback=True)
+                    _del_if_empty(genome_mapping, CFG_ASSETS_KEY, [genomes, genome])
+                    _del_if_empty(genomes, genome)
+                    # if the asset was removed altogether, this is a no-op
+                    if asset_mapping.get(CFG_ASSET_DEFAULT_TAG_KEY) == tag:
+                        del asset_mapping[CFG_ASSET_DEFAULT_TAG_KEY]
+                    if len(genomes) < n_genomes:
+                        self._forget_genome_aliases(digest)
+                    if len(genomes) == 0:
                         self[CFG_GENOMES_KEY] = None
         return self
 
@@ -2324,9 +2537,11 @@ class RefGenConf(yacman.YacAttMap):
             genome = force_digest or self.get_genome_alias_digest(
                 alias=genome, fallback=True
             )
-            _safe_setdef(self[CFG_GENOMES_KEY], genome, PXAM({CFG_ASSETS_KEY: PXAM()}))
+            genome_mapping = _safe_setdef(
+                self[CFG_GENOMES_KEY], genome, PXAM({CFG_ASSETS_KEY: PXAM()})
+            )
             if _check_insert_data(data, Mapping, "data"):
-                self[CFG_GENOMES_KEY][genome].update(data)
+                genome_mapping.update(data)
         return self
 
     def _update_genome_servers(self, url, reset=False):
@@ -2375,21 +2590,25 @@ class RefGenConf(yacman.YacAttMap):
         """
         unsub_list = []
         ori_servers = self[CFG_SERVERS_KEY]
-        for s in urls:
-            try:
-                ori_servers.remove(s)
+        subscribed = set(ori_servers)
+        for s in dict.fromkeys(urls):
+            if s in subscribed:
                 unsub_list.append(s)
-            except ValueError:
+            else:
                 _LOGGER.warning(
                     "URL '{}' not in genome_servers list: {}".format(s, ori_servers)
                 )
+        if not unsub_list:
+            # nothing changed, no need to lock and write the file
+            return
+        dropped = set(unsub_list)
+        kept_servers = [s for s in ori_servers if s not in dropped]
         if self.file_path and not no_write:
             with self as r:
-                r._update_genome_servers(ori_servers, reset=True)
+                r._update_genome_servers(kept_servers, reset=True)
         else:
-            self._update_genome_servers(ori_servers, reset=True)
-        if unsub_list:
-            _LOGGER.info("Unsubscribed from: {}".format(", ".join(unsub_list)))
+            self._update_genome_servers(kept_servers, reset=True)
+        _LOGGER.info("Unsubscribed from: {}".format(", ".join(unsub_list)))
 
     def getseq(self, genome, locus, as_str=False):
         """
@@ -2402,19 +2621,31 @@ class RefGenConf(yacman.YacAttMap):
             and return just the sequence
         :return str | pyfaidx.FastaRecord | pyfaidx.Sequence: selected sequence
         """
-        import pyfaidx
+        fasta_path = self.seek_src(genome, "fasta", strict_exists=True)
+        # the opened files are kept, so the index is not read again for every locus
+        fasta_handles = self._cache.setdefault(_FASTA_HANDLES, {})
+        try:
+            fa = fasta_handles[fasta_path]
+        except KeyError:
+            # pyfaidx is only needed to open a file, so import it lazily here
+            import pyfaidx
 
-        fa = pyfaidx.Fasta(self.seek_src(genome, "fasta", strict_exists=True))
-        locus_split = locus.split(":")
-        chr = fa[locus_split[0]]
-        if len(locus_split) == 1:
+            fa = fasta_handles[fasta_path] = pyfaidx.Fasta(fasta_path)
+        chrom, _, coords = locus.partition(":")
+        chr = fa[chrom]
+        if not coords:
             return str(chr) if as_str else chr
-        start, end = locus_split[1].split("-")
-        _LOGGER.debug(
-            "chr: '{}', start: '{}', end: '{}'".format(locus_split[0], start, end)
-        )
+        start, end = coords.split("-")
+        _LOGGER.debug("chr: '%s', start: '%s', end: '%s'", chrom, start, end)
         return str(chr[int(start) : int(end)]) if as_str else chr[int(start) : int(end)]
 
+    def close_fastas(self):
+        """
+        Close the FASTA files kept open by getseq
+        """
+        for fa in self._cache.pop(_FASTA_HANDLES, {}).values():
+            fa.close()
+
     def get_genome_attributes(self, genome):
         """
         Get the dictionary attributes, like checksum, contents, description.
@@ -2423,10 +2654,9 @@ class RefGenConf(yacman.YacAttMap):
         :param str genome: genome to get the attributes dict for
         :return Mapping[str, str]: available genome attributes
         """
+        genome_mapping = self[CFG_GENOMES_KEY][genome]
         return {
-            k: self[CFG_GENOMES_KEY][genome][k]
-            for k in CFG_GENOME_ATTRS_KEYS
-            if k in self[CFG_GENOMES_KEY][genome]
+            k: genome_mapping[k] for k in CFG_GENOME_ATTRS_KEYS if k in genome_mapping
         }
 
     def is_asset_complete(self, genome, asset, tag):
@@ -2442,7 +2672,7 @@ class RefGenConf(yacman.YacAttMap):
         tag_data = self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset][
             CFG_ASSET_TAGS_KEY
         ][tag]
-        return all([r in tag_data for r in REQ_TAG_ATTRS])
+        return all(r in tag_data for r in REQ_TAG_ATTRS)
 
     def _invert_genomes(self, order=None):
         """Map each asset type/kind/name to a collection of assemblies.
@@ -2459,12 +2689,13 @@ class RefGenConf(yacman.YacAttMap):
             and collection of reference genome assembly names for which the
             asset type is available
         """
-        genomes = {}
+        genomes = defaultdict(list)
         for g, am in self[CFG_GENOMES_KEY].items():
-            for a in am[CFG_ASSETS_KEY].keys():
-                genomes.setdefault(a, []).append(g)
-        assets = sorted(genomes.keys(), key=order)
-        return OrderedDict([(a, sorted(genomes[a], key=order)) for a in assets])
+            for a in am[CFG_ASSETS_KEY]:
+                genomes[a].append(g)
+        return OrderedDict(
+            (a, sorted(genomes[a], key=order)) for a in sorted(genomes, key=order)
+        )
 
     def _chk_digest_if_avail(self, genome, remote_asset_name, remote_digest):
         """
@@ -2523,13 +2754,16 @@ class RefGenConf(yacman.YacAttMap):
             # we need to allow for missing seek_keys section so that the digest is
             # respected even from the previously populated 'incomplete asset' from
             # the server
-            self._assert_gat_exists(
-                genome,
-                asset,
-                tag,
-                allow_incomplete=not self.is_asset_complete(genome, asset, tag),
+            tag_data = _assert_gat_exists(
+                self[CFG_GENOMES_KEY], genome, asset, tag, allow_incomplete=True
             )
-        except (KeyError, MissingAssetError, MissingGenomeError, MissingSeekKeyError):
+        except (
+            KeyError,
+            MissingAssetError,
+            MissingGenomeError,
+            MissingSeekKeyError,
+            MissingTagError,
+        ):
             self.update_tags(
                 genome, asset, tag, {CFG_ASSET_CHECKSUM_KEY: remote_digest}
             )
@@ -2538,9 +2772,7 @@ class RefGenConf(yacman.YacAttMap):
                 f"Populating with server data"
             )
         else:
-            local_digest = self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset][
-                CFG_ASSET_TAGS_KEY
-            ][tag][CFG_ASSET_CHECKSUM_KEY]
+            local_digest = tag_data[CFG_ASSET_CHECKSUM_KEY]
             if remote_digest != local_digest:
                 raise RemoteDigestMismatchError(asset, local_digest, remote_digest)
         finally:
@@ -2558,11 +2790,15 @@ class RefGenConf(yacman.YacAttMap):
         :param str tag: tag identifier
         :return str: asset digest for the tag
         """
-        self._assert_gat_exists(genome, asset, tag)
-        tag = tag or self.get_default_tag(genome, asset)
-        a = self[CFG_GENOMES_KEY][genome][CFG_ASSETS_KEY][asset]
-        if CFG_ASSET_CHECKSUM_KEY in a[CFG_ASSET_TAGS_KEY][tag]:
-            return a[CFG_ASSET_TAGS_KEY][tag][CFG_ASSET_CHECKSUM_KEY]
+        tag_data = self._assert_gat_exists(genome, asset, tag or None)
+        if not tag:
+            # the asset section is at hand, look the default tag up there first
+            tag = tag_data.get(CFG_ASSET_DEFAULT_TAG_KEY) or self.get_default_tag(
+                genome, asset
+            )
+            tag_data = tag_data[CFG_ASSET_TAGS_KEY][tag]
+        if CFG_ASSET_CHECKSUM_KEY in tag_data:
+            return tag_data[CFG_ASSET_CHECKSUM_KEY]
         raise MissingConfigDataError(
             "Digest does not exist for: {}/{}:{}".format(genome, asset, tag)
         )
@@ -2647,7 +2883,7 @@ class RefGenConf(yacman.YacAttMap):
         :param str hook: hook identifier
         """
         for name, func in self.plugins[hook].items():
-            _LOGGER.debug("Running {} plugin: {}".format(hook, name))
+            _LOGGER.debug("Running %s plugin: %s", hook, name)
             func(self)
 
     def write(self, filepath=None):
@@ -2727,10 +2963,11 @@ class RefGenConf(yacman.YacAttMap):
         :param str gname: genome query name, can be the actual key or its alias
         :return str: genome id
         """
-        self._assert_gat_exists(gname)
-        if gname in self[CFG_GENOMES_KEY].keys():
+        genomes = self[CFG_GENOMES_KEY]
+        _assert_gat_exists(genomes, gname)
+        if gname in genomes:
             return gname
-        return self[CFG_GENOMES_KEY].get_key(alias=gname)
+        return genomes.get_key(alias=gname)
 
     def _assert_gat_exists(self, gname, aname=None, tname=None, allow_incomplete=False):
         """
@@ -2738,12 +2975,11 @@ class RefGenConf(yacman.YacAttMap):
         has any seek keys defined.
         Seek keys are required for the asset completeness.
 
-        :param Mapping[str, Mapping[str, Mapping[str, object]]] genomes: nested
-            collection of key-value pairs, keyed at top level on genome ID, then by
-            asset name, then by asset attribute
         :param str gname: top level key to query -- genome ID, e.g. mm10
         :param str aname: second-level key to query -- asset name, e.g. fasta
         :param str tname: third-level key to query -- tag name, e.g. default
+        :param bool allow_incomplete: whether a tag with no seek keys is allowed
+        :return Mapping: the most specific section checked: tag, asset or genome
         :raise MissingGenomeError: if the given key-value pair collection does not
             contain as a top-level key the given genome ID
         :raise MissingAssetError: if the given key-value pair collection does
@@ -2753,38 +2989,9 @@ class RefGenConf(yacman.YacAttMap):
             the structure of the given genomes mapping suggests that it was
             parsed from an improperly formatted/structured genome config file.
         """
-        _LOGGER.debug(f"checking existence of: {gname}/{aname}:{tname}")
-        try:
-            genome = self[CFG_GENOMES_KEY][gname]
-        except KeyError:
-            raise MissingGenomeError(f"Your genomes do not include '{gname}'")
-        if aname is not None:
-            try:
-                asset_data = genome[CFG_ASSETS_KEY][aname]
-            except KeyError:
-                raise MissingAssetError(
-                    f"Genome '{gname}' exists, but asset '{aname}' is missing"
-                )
-            except TypeError:
-                _raise_not_mapping(asset_data, "Asset section ")
-            if tname is not None:
-                try:
-                    tag_data = asset_data[CFG_ASSET_TAGS_KEY][tname]
-                except KeyError:
-                    raise MissingTagError(
-                        f"genome/asset bundle '{gname}/{aname}' exists, but tag "
-                        f"'{tname}' is missing"
-                    )
-                except TypeError:
-                    _raise_not_mapping(asset_data, "Asset section ")
-                try:
-                    tag_data[CFG_SEEK_KEYS_KEY]
-                except KeyError:
-                    if not allow_incomplete:
-                        raise MissingSeekKeyError(
-                            f"Asset incomplete. No seek keys are defined for "
-                            f"'{gname}/{aname}:{tname}'. Build or pull the asset again."
-                        )
+        return _assert_gat_exists(
+            self[CFG_GENOMES_KEY], gname, aname, tname, allow_incomplete
+        )
 
     def _list_remote(
         self,
@@ -2823,28 +3030,25 @@ class RefGenConf(yacman.YacAttMap):
             # expects remote genomes to be supplied as aliases; no conversion
             genomes = sorted(external_genomes, key=order)
         else:
-            genomes = [
-                self.get_genome_alias(x, fallback=True)
-                for x in sorted(self[CFG_GENOMES_KEY].keys(), key=order)
-            ]
+            genomes = self._get_genome_aliases(
+                sorted(self[CFG_GENOMES_KEY].keys(), key=order)
+            )
         if not genome:
             return genomes
-        genome = [
-            self.get_genome_alias(digest=x, fallback=True)
-            for x in _make_list_of_str(genome)
-        ]
+        genome = self._get_genome_aliases(_make_list_of_str(genome))
+        selected = set(genomes)
         if strict:
             missing = []
             filtered = []
             for g in genome:
-                if g in genomes:
+                if g in selected:
                     filtered.append(g)
                 else:
                     missing.append(g)
             if missing:
                 _LOGGER.warning(f"Genomes do not include: {', '.join(missing)}")
             return None if not filtered else filtered
-        return genomes if not all(x in genomes for x in genome) else genome
+        return genomes if not all(x in selected for x in genome) else genome
 
 
 def upgrade_config(
@@ -2868,8 +3072,9 @@ def upgrade_config(
             genome server URL base, genome, and asset
     :param callable link_fun: function to use to link files, e.g os.symlink or os.link
     """
-    # init rgc obj with provided config
-    current_version = yacman.YacAttMap(filepath=filepath)[CFG_VERSION_KEY]
+    # only the version is needed to pick the config class, so the file is just
+    # parsed, not turned into a locked config object
+    current_version = yacman.load_yaml(filepath)[CFG_VERSION_KEY]
 
     if current_version == 0.3:
         from .refgenconf_v03 import _RefGenConfV03 as OldRefGenConf
@@ -2906,10 +3111,8 @@ def upgrade_config(
         return False
 
     # test server(s) and prompt
-    cnt = 0
     incompat_servers = []
     for server in rgc[CFG_SERVERS_KEY]:
-        cnt += 1
         try:
             get_json_url(server, API_VERSION + API_ID_ASSETS)
         except (KeyError, ConnectionError, DownloadJsonError):
@@ -2922,24 +3125,28 @@ def upgrade_config(
 
     # check digest availability
     missing_digest = []
-    for genome, genome_v in rgc[CFG_GENOMES_KEY].items():
+    # the digest endpoint does not depend on the genome, so the servers are
+    # probed for it only once, when the first genome lacks a local fasta asset
+    digest_missing = None
+    for genome in rgc[CFG_GENOMES_KEY]:
         try:
             tag = rgc.get_default_tag(genome, "fasta")
             asset_path = rgc.seek(genome, "fasta", tag, "fasta")
             if not os.path.exists(asset_path):
                 raise FileNotFoundError
         except (MissingAssetError, FileNotFoundError):
-            cnt = 0
-            servers = rgc[CFG_SERVERS_KEY]
-            for server in servers:
-                cnt += 1
-                try:
-                    get_json_url(s=server, i=API_ID_ALIAS_DIGEST).format(alias=genome)
+            if digest_missing is None:
+                servers = rgc[CFG_SERVERS_KEY]
+                digest_missing = bool(servers)
+                for server in servers:
+                    try:
+                        get_json_url(s=server, i=API_ID_ALIAS_DIGEST)
+                    except (KeyError, ConnectionError, DownloadJsonError):
+                        continue
+                    digest_missing = False
                     break
-                except (KeyError, ConnectionError, DownloadJsonError) as e:
-                    if cnt == len(servers):
-                        missing_digest.append(genome)
-                    continue
+            if digest_missing:
+                missing_digest.append(genome)
 
     if (
         not force
@@ -2964,38 +3171,103 @@ def upgrade_config(
     return True
 
 
-def _download_url_progress(url, output_path, name, params=None):
+def _scan_tree(path):
+    """
+    Walk the directory tree once and collect the relative paths of its contents
+
+    Symbolic links to directories are listed as directories, but not followed,
+    and unreadable directories are skipped, which mirrors the os.walk defaults.
+
+    :param str path: path to the directory to scan
+    :return (list[str], dict[str, list[str]]): relative paths of directories
+        and names of the files keyed by the relative path of their directory
+    """
+    rel_dirs, files = [], {}
+    stack = [""]
+    while stack:
+        rel_root = stack.pop()
+        try:
+            it = os.scandir(os.path.join(path, rel_root))
+        except OSError:
+            # unreadable or nonexistent directories are skipped, like in os.walk
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir():
+                    rel = os.path.join(rel_root, entry.name)
+                    rel_dirs.append(rel)
+                    if not entry.is_symlink():
+                        stack.append(rel)
+                else:
+                    files.setdefault(rel_root, []).append(entry.name)
+    return rel_dirs, files
+
+
+def _link_files(target_dir, dst_dir, names, rename, link_fun=None):
+    """
+    Link the files from a single directory into the destination directory
+
+    :param str target_dir: path to the directory with the files to link,
+        relative to the destination directory
+    :param str dst_dir: path to the destination directory
+    :param Iterable[str] names: names of the files to link
+    :param callable(str) -> str rename: how to name the links
+    :param callable link_fun: function to use to link files, e.g os.symlink
+        or os.link. Symbolic links are created relative to the open
+        destination directory if not provided
+    """
+    dir_fd = None
+    if link_fun is None:
+        if os.symlink in os.supports_dir_fd:
+            dir_fd = os.open(dst_dir, os.O_RDONLY | os.O_DIRECTORY)
+        else:
+            link_fun = os.symlink
+    try:
+        for name in names:
+            target = os.path.join(target_dir, name)
+            # existing links are detected by the failing link call itself;
+            # os.path.lexists can't check relative to dir_fd and would add
+            # a second, racy system call per file
+            try:
+                if dir_fd is None:
+                    link_fun(target, os.path.join(dst_dir, rename(name)))
+                else:
+                    os.symlink(target, rename(name), dir_fd=dir_fd)
+            except FileExistsError:
+                _LOGGER.warning(
+                    "Could not create link, file exists: "
+                    f"{os.path.join(dst_dir, rename(name))}"
+                )
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+
+def _download_url_progress(
+    url, output_path, name, params=None, chunk_size=1 << 20, hasher=None, resume=False
+):
     """
     Download asset at given URL to given filepath, show progress along the way.
 
+    The response is streamed to the file over the shared HTTP session, so the
+    connection is reused and the size is known from the headers of the same
+    response.
+
     :param str url: server API endpoint
     :param str output_path: path to file to save download
     :param str name: name to display in front of the progress bar
     :param dict params: query parameters to be added to the request
+    :param int chunk_size: number of bytes to read and write at once
+    :param hasher: hash object, e.g. hashlib.md5(), to update with the
+        downloaded data as it's written, which saves reading the file again
+    :param bool resume: whether to continue an incomplete download of the file
+        that exists at the output path; the whole file is downloaded again
+        if the server does not support range requests
+    :raise urllib.error.HTTPError: if the server responds with an error status
+    :raise urllib.error.ContentTooShortError: if less data is received
+        than announced
     """
-
-    class _HookProgress(Progress):
-        """
-        Internal class to connect progress bar with URL retrieval context manager
-        """
-
-        @staticmethod
-        def rep_hook(count, blockSize, totalSize):
-            """
-            Needs to take three arguments in this order
-            """
-            progress.update(task_id, advance=blockSize)
-
-    def _get_content_len(x):
-        """
-        Get length of remote content
-        """
-        f = urlopen(x)
-        content_len = f.info().get("Content-length")
-        f.close()
-        return int(content_len)
-
-    progress = _HookProgress(
+    progress = Progress(
         TextColumn("{task.fields[n]}", justify="right"),
         BarColumn(bar_width=None),
         "[magenta]{task.percentage:>3.1f}%",
@@ -3006,11 +3278,96 @@ def _download_url_progress(url, output_path, name, params=None):
         "•",
         _TimeRemainingColumn(),
     )
+    existing = (
+        os.path.getsize(output_path) if resume and os.path.isfile(output_path) else 0
+    )
+    headers = {"Range": f"bytes={existing}-"} if existing else None
+    with _get_session().get(url, params=params, headers=headers, stream=True) as resp:
+        if not resp.ok:
+            raise HTTPError(resp.url, resp.status_code, resp.reason, resp.headers, None)
+        if resp.status_code != 206:
+            # the server sent the whole file
+            existing = 0
+        elif hasher is not None:
+            with open(output_path, "rb") as f:
+                for chunk in iter(partial(f.read, chunk_size), b""):
+                    hasher.update(chunk)
+        content_len = existing + int(resp.headers.get("Content-Length", 0))
+        task_id = progress.add_task("download", n=name, total=content_len)
+        progress.update(task_id, advance=existing)
+        received = existing
+        with progress, open(output_path, "ab" if existing else "wb") as f:
+            # the raw stream is not decoded, the archive is saved as served
+            for chunk in resp.raw.stream(chunk_size, decode_content=False):
+                f.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                received += len(chunk)
+                progress.update(task_id, advance=len(chunk))
+    if received < content_len:
+        raise ContentTooShortError(
+            f"retrieval incomplete: got only {received} out of {content_len} bytes",
+            None,
+        )
 
-    url = url if params is None else url + "?{}".format(urlencode(params))
-    task_id = progress.add_task("download", n=name, total=_get_content_len(url))
-    with progress as p:
-        urlretrieve(url, filename=output_path, reporthook=p.rep_hook)
+
+def _probe_asset_server(server_url, get_json_url, genome, asset, tag):
+    """
+    Request the attributes of an asset from a server
+
+    :param str server_url: URL of the server to query
+    :param function(str, str) -> str get_json_url: how to build URL from
+        genome server URL base, genome, and asset
+    :param str genome: genome digest
+    :param str asset: asset name
+    :param str | NoneType tag: tag name; the server's default tag
+        is requested if not specified
+    :return (str, dict | refgenconf.DownloadJsonError): the determined tag
+        and the asset attributes, or the error raised when requesting them
+    :raise refgenconf.DownloadJsonError: if the default tag can't be retrieved
+    """
+    if tag is None:
+        tag = send_data_request(
+            get_json_url(server_url, API_ID_DEFAULT_TAG).format(
+                genome=genome, asset=asset
+            )
+        )
+    tag = str(tag)
+    url_asset_attrs = get_json_url(server_url, API_ID_ASSET_ATTRS).format(
+        genome=genome, asset=asset
+    )
+    try:
+        return tag, send_data_request(url_asset_attrs, params={"tag": tag})
+    except DownloadJsonError as e:
+        return tag, e
+
+
+def _alias_asset_path(
+    alias_dir, genome_digest, genome_id, asset_name, tag_name, seek_val
+):
+    """
+    Get the path to the asset in the alias directory of the selected genome alias
+
+    The genome digest is replaced with the alias only in the part of the
+    path below the genome directory, just like the alias directory tree is
+    created, so the alias directory path itself is never altered.
+
+    :param str alias_dir: path to the directory with the alias symlinks
+    :param str genome_digest: digest of the genome
+    :param str genome_id: alias of the genome to get the path for
+    :param str asset_name: name of the asset
+    :param str tag_name: name of the tag
+    :param str seek_val: value of the seek key, relative to the asset
+        directory; empty or '.' to point to the asset directory itself
+    :return str: path to the asset
+    """
+    rel_parts = [asset_name, tag_name]
+    if seek_val and seek_val != ".":
+        rel_parts.append(seek_val)
+    rel_path = os.path.join(*rel_parts)
+    return os.path.join(
+        alias_dir, genome_id, rel_path.replace(genome_digest, genome_id)
+    )
 
 
 def _genome_asset_path(
@@ -3039,30 +3396,46 @@ def _genome_asset_path(
         the structure of the given genomes mapping suggests that it was
         parsed from an improperly formatted/structured genome config file.
     """
-    _assert_gat_exists(genomes, gname, aname, tname)
-    asset_tag_data = genomes[gname][CFG_ASSETS_KEY][aname][CFG_ASSET_TAGS_KEY][tname]
+    asset_tag_data = _assert_gat_exists(genomes, gname, aname, tname)
+    return _tag_asset_path(
+        asset_tag_data, gname, aname, tname, seek_key, enclosing_dir, no_tag
+    )
+
+
+def _tag_asset_path(
+    asset_tag_data, gname, aname, tname, seek_key, enclosing_dir, no_tag=False
+):
+    """
+    Retrieve the raw path value for a particular asset from its tag data.
+
+    :param Mapping[str, object] asset_tag_data: genome/asset:tag data section
+    :param str gname: genome ID the tag data belongs to, e.g. mm10
+    :param str aname: asset name the tag data belongs to, e.g. fasta
+    :param str tname: tag name the tag data belongs to, e.g. default
+    :param str seek_key: seek key to query, e.g. chrom_sizes
+    :param bool enclosing_dir: whether a path to the entire enclosing directory should
+        be returned
+    :param bool no_tag: whether the tag directory should be left out of the path
+    :return str: raw path value for a particular asset
+    :raise MissingSeekKeyError: if the requested seek key is not defined
+    """
+    path_val = asset_tag_data[CFG_ASSET_PATH_KEY]
+    tag_path = path_val if no_tag else os.path.join(path_val, tname)
     if enclosing_dir:
-        if no_tag:
-            return asset_tag_data[CFG_ASSET_PATH_KEY]
-        return os.path.join(asset_tag_data[CFG_ASSET_PATH_KEY], tname)
+        return tag_path
+    seek_keys = asset_tag_data[CFG_SEEK_KEYS_KEY]
     if seek_key is None:
-        if aname in asset_tag_data[CFG_SEEK_KEYS_KEY]:
-            seek_key = aname
-        else:
-            if no_tag:
-                return asset_tag_data[CFG_ASSET_PATH_KEY]
-            return os.path.join(asset_tag_data[CFG_ASSET_PATH_KEY], tname)
+        if aname not in seek_keys:
+            return tag_path
+        seek_key = aname
     try:
-        seek_key_value = asset_tag_data[CFG_SEEK_KEYS_KEY][seek_key]
+        seek_key_value = seek_keys[seek_key]
     except KeyError:
         raise MissingSeekKeyError(
             f"genome/asset:tag bundle '{gname}/{aname}:{tname}' exists, but "
             f"seek_key '{seek_key}' is missing"
         )
-    else:
-        if no_tag:
-            return os.path.join(asset_tag_data[CFG_ASSET_PATH_KEY], seek_key_value)
-        return os.path.join(asset_tag_data[CFG_ASSET_PATH_KEY], tname, seek_key_value)
+    return os.path.join(tag_path, seek_key_value)
 
 
 def _assert_gat_exists(genomes, gname, aname=None, tname=None, allow_incomplete=False):
@@ -3076,6 +3449,8 @@ def _assert_gat_exists(genomes, gname, aname=None, tname=None, allow_incomplete=
     :param str gname: top level key to query -- genome ID, e.g. mm10
     :param str aname: second-level key to query -- asset name, e.g. fasta
     :param str tname: third-level key to query -- tag name, e.g. default
+    :param bool allow_incomplete: whether a tag with no seek keys is allowed
+    :return Mapping: the most specific section checked: tag, asset or genome
     :raise MissingGenomeError: if the given key-value pair collection does not
         contain as a top-level key the given genome ID
     :raise MissingAssetError: if the given key-value pair collection does
@@ -3085,7 +3460,7 @@ def _assert_gat_exists(genomes, gname, aname=None, tname=None, allow_incomplete=
         the structure of the given genomes mapping suggests that it was
         parsed from an improperly formatted/structured genome config file.
     """
-    _LOGGER.debug(f"checking existence of: {gname}/{aname}:{tname}")
+    _LOGGER.debug("checking existence of: %s/%s:%s", gname, aname, tname)
     try:
         genome = genomes[gname]
     except KeyError:
@@ -3109,14 +3484,29 @@ def _assert_gat_exists(genomes, gname, aname=None, tname=None, allow_incomplete=
                 )
             except TypeError:
                 _raise_not_mapping(asset_data, "Asset section ")
-            try:
-                tag_data[CFG_SEEK_KEYS_KEY]
-            except KeyError:
-                if not allow_incomplete:
-                    raise MissingSeekKeyError(
-                        f"Asset incomplete. No seek keys are defined for "
-                        f"'{gname}/{aname}:{tname}'. Build or pull the asset again."
-                    )
+            if not allow_incomplete and CFG_SEEK_KEYS_KEY not in tag_data:
+                raise MissingSeekKeyError(
+                    f"Asset incomplete. No seek keys are defined for "
+                    f"'{gname}/{aname}:{tname}'. Build or pull the asset again."
+                )
+            return tag_data
+        return asset_data
+    return genome
+
+
+def _get_tag_data(genomes, genome, asset, tag):
+    """
+    Get the data of a genome/asset:tag combination, if it's defined
+
+    :param Mapping genomes: the genomes section of the config
+    :param str genome: genome digest or alias
+    :param str asset: asset name
+    :param str tag: tag name
+    :return Mapping | NoneType: the tag data or None if it's not defined
+    """
+    assets = (genomes.get(genome) or {}).get(CFG_ASSETS_KEY) or {}
+    tags = (assets.get(asset) or {}).get(CFG_ASSET_TAGS_KEY) or {}
+    return tags.get(tag)
 
 
 def _is_large_archive(size, cutoff=10):
@@ -3127,20 +3517,17 @@ def _is_large_archive(size, cutoff=10):
     :return bool: the decision
     """
 
-    def _str2float(x):
-        """
-        Remove any letters from the file size string and cast the remainder to float
-        """
-        return float("".join(c for c in x if c in "0123456789."))
-
-    _LOGGER.debug(f"Checking archive size: '{size}'")
-    if size.endswith("MB"):
-        # convert to gigs
-        size = "{0:f}GB".format(_str2float(size) / 1000)
-    if size.endswith("KB"):
-        # convert to gigs
-        size = "{0:f}GB".format(_str2float(size) / 1000 ** 2)
-    return size.endswith("TB") or (size.endswith("GB") and _str2float(size) > cutoff)
+    _LOGGER.debug("Checking archive size: '%s'", size)
+    unit = size[-2:]
+    if unit == "TB":
+        return True
+    try:
+        units_per_gb = _UNITS_PER_GB[unit]
+    except KeyError:
+        return False
+    # remove any other characters from the number and compare it in gigs
+    number = float("".join(c for c in size[:-2] if c in "0123456789."))
+    return number / units_per_gb > cutoff
 
 
 def _make_genome_assets_line(
@@ -3185,21 +3572,17 @@ def _make_asset_tags_product(assets, asset_tag_delim=":", asset_sk_delim="."):
     tagged_assets = []
     for aname, asset in assets.items():
         for tname, tag in asset[CFG_ASSET_TAGS_KEY].items():
-            sk_assets = []
-            seek_keys = get_tag_seek_keys(tag)
             # proceed only if asset is 'complete' -- has seek_keys
-            if seek_keys is not None:
-                # add seek_keys if exist and different from the asset name,
-                # otherwise just the asset name
-                sk_assets.extend(
-                    [
-                        asset_sk_delim.join([aname, sk]) if sk != aname else aname
-                        for sk in seek_keys
-                    ]
-                )
-            # add tags to the asset.seek_key list
+            if CFG_SEEK_KEYS_KEY not in tag:
+                continue
+            seek_keys = tag[CFG_SEEK_KEYS_KEY]
+            # add seek_keys if exist and different from the asset name,
+            # otherwise just the asset name; then add the tag to each of them
+            tag_suffix = asset_tag_delim + tname
             tagged_assets.extend(
-                [asset_tag_delim.join(i) for i in itertools.product(sk_assets, [tname])]
+                (asset_sk_delim.join([aname, sk]) if sk != aname else aname)
+                + tag_suffix
+                for sk in seek_keys
             )
     return tagged_assets
 
@@ -3221,33 +3604,29 @@ def _make_list_of_str(arg):
     :return list: list of strings
     :raise TypeError: if a fault argument was provided
     """
-
-    def _raise_faulty_arg():
-        raise TypeError(
-            f"Provided argument has to be a list[str] or a str, "
-            f"got '{arg.__class__.__name__}'"
-        )
-
     if isinstance(arg, str):
         return [arg]
-    elif isinstance(arg, list):
-        if not all(isinstance(i, str) for i in arg):
-            _raise_faulty_arg()
+    if isinstance(arg, list):
+        for i in arg:
+            if not isinstance(i, str):
+                break
         else:
             return arg
-    else:
-        _raise_faulty_arg()
+    raise TypeError(
+        f"Provided argument has to be a list[str] or a str, "
+        f"got '{arg.__class__.__name__}'"
+    )
 
 
 def _extend_unique(l1, l2):
     """
-    Extend a list with no duplicates
+    Extend a list with no duplicates, preserving the order of the items
 
     :param list l1: original list
     :param list l2: list with items to add
     :return list: an extended list
     """
-    return l1 + list(set(l2) - set(l1))
+    return list(dict.fromkeys(itertools.chain(l1, l2)))
 
 
 def get_asset_tags(asset):
@@ -3260,7 +3639,7 @@ def get_asset_tags(asset):
     :param Mapping asset: a single asset part of the RefGenConf
     :return list: asset tags
     """
-    return [t for t in asset[CFG_ASSET_TAGS_KEY]]
+    return list(asset[CFG_ASSET_TAGS_KEY])
 
 
 def get_tag_seek_keys(tag):
@@ -3270,7 +3649,7 @@ def get_tag_seek_keys(tag):
     :param Mapping tag: a single tag part of the RefGenConf
     :return list: tag seek keys
     """
-    return [s for s in tag[CFG_SEEK_KEYS_KEY]] if CFG_SEEK_KEYS_KEY in tag else None
+    return list(tag[CFG_SEEK_KEYS_KEY]) if CFG_SEEK_KEYS_KEY in tag else None
 
 
 def construct_request_url(server_url, operation_id, api_prefix=API_VERSION):
@@ -3298,10 +3677,13 @@ def construct_request_url(server_url, operation_id, api_prefix=API_VERSION):
         )
 
 
+@lru_cache(maxsize=64)
 def _get_server_endpoints_mapping(url):
     """
     Establishes the API with the server using operationId field in the openAPI
-    JSON description
+    JSON description; cached, since the same servers are asked for different
+    endpoints over and over. This is the only cache of the server endpoints,
+    reset it with _get_server_endpoints_mapping.cache_clear()
 
     :param str url: server URL
     :return dict: endpoints mapped by their operationIds
@@ -3334,17 +3716,20 @@ def _remove(path):
     """
     remove asset if it is a dir or a file
 
+    The path is inspected with a single lstat call; a symbolic link is
+    removed itself, never the tree it points to.
+
     :param str path: path to the entity to remove, either a file or a dir
     :return str: removed path
     """
-    from shutil import rmtree
-
-    if os.path.isfile(path):
-        os.remove(path)
-    elif os.path.isdir(path):
-        rmtree(path)
-    else:
+    try:
+        mode = os.lstat(path).st_mode
+    except OSError:
         raise ValueError(f"path '{path}' is neither a file nor a dir.")
+    if S_ISDIR(mode):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
     return path
 
 
@@ -3368,8 +3753,10 @@ def _entity_dir_removal_log(directory, entity_class, asset_dict, removed_entitie
         removed_entities.append(_remove(directory))
     else:
         _LOGGER.debug(
-            f"Didn't remove '{directory}' since it does not match the {entity_class} "
-            f"name: {asset_dict[entity_class]}"
+            "Didn't remove '%s' since it does not match the %s name: %s",
+            directory,
+            entity_class,
+            asset_dict[entity_class],
         )
 
 
@@ -3382,13 +3769,111 @@ def _safe_setdef(mapping, attr, val):
     :param str attr: attribute to update
     :param val: value to assign as the default
     :raise GenomeConfigFormatError: if mapping is of incorrect class
-    :return Mapping: updated mapping
+    :return object: the value stored under the attribute
     """
     try:
-        mapping.setdefault(attr, val)
+        value = mapping.setdefault(attr, val)
     except (TypeError, AttributeError):
         _raise_not_mapping(mapping, f"Cannot update; Section '{attr}' ")
-    return mapping
+    # a newly set default may have been converted by the mapping when stored
+    return mapping[attr] if value is val else value
+
+
+def _count_args(fun):
+    """
+    Count the positional arguments of a function; cached, since the same
+    existence check functions are inspected over and over. The functions are
+    referenced weakly, and the ones that can't be are inspected every time
+
+    :param callable fun: function to inspect
+    :return int: number of positional arguments
+    """
+    try:
+        return _ARG_COUNTS[fun]
+    except KeyError:
+        count = _ARG_COUNTS[fun] = len(finspect(fun).args)
+        return count
+    except TypeError:
+        # not hashable or weakly referenceable
+        return len(finspect(fun).args)
+
+
+def _read_json_file(path):
+    """
+    Read a JSON file, if it exists and is valid
+
+    :param str path: path to the file to read
+    :return dict | list | NoneType: file contents; None if it can't be read
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_file(path, data):
+    """
+    Write data to a JSON file; the file is replaced in one step, so the
+    readers never see a partially written file
+
+    :param str path: path to the file to write
+    :param dict | list data: data to write
+    """
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        _LOGGER.debug("Could not write JSON file '%s': %s", path, e)
+
+
+def _update_json_file(path, key, value, wait_max=60):
+    """
+    Set a value in a JSON file with a mapping; the file is read and written
+    under a lock, so concurrent updates do not drop each other's entries
+
+    :param str path: path to the file to update
+    :param str key: key to set the value for
+    :param value: value to set
+    :param int wait_max: how long to wait for the lock to be released
+    """
+    try:
+        create_lock(path, wait_max)
+    except (OSError, RuntimeError) as e:
+        _LOGGER.debug("Could not lock JSON file '%s': %s", path, e)
+        return
+    try:
+        data = _read_json_file(path) or {}
+        data[key] = value
+        _write_json_file(path, data)
+    finally:
+        remove_lock(path)
+
+
+@lru_cache(maxsize=4096)
+def _parse_registry_path(rpstring):
+    """
+    Parse a registry path; cached, since the same relatives' registry paths
+    are parsed over and over
+
+    :param str rpstring: registry path to parse
+    :return dict | NoneType: parsed registry path components
+    """
+    return parse_registry_path(rpstring)
+
+
+def prp(rpstring):
+    """
+    Parse a registry path into its components
+
+    :param str rpstring: registry path to parse
+    :return dict | NoneType: parsed registry path components, a new dict
+        that can be modified by the caller
+    """
+    parsed = _parse_registry_path(rpstring)
+    return parsed if parsed is None else dict(parsed)
 
 
 def _raise_not_mapping(mapping, prefix=""):
@@ -3398,7 +3883,9 @@ def _raise_not_mapping(mapping, prefix=""):
     )
 
 
-def _populate_refgenie_registry_path(rgc, glob, seek_method_name, remote_class=None):
+def _populate_refgenie_registry_path(
+    rgc, glob, seek_method_name, remote_class=None, seek_cache=None
+):
     """
     Populates refgenie references from refgenie://genome/asset:tag registry paths
 
@@ -3408,22 +3895,19 @@ def _populate_refgenie_registry_path(rgc, glob, seek_method_name, remote_class=N
     :param bool seek_method_name: a RefGenConf method name to use to seek for the
         strings to replace matched refgenie registry paths, e.g. 'seek' or 'seekr'
     :param str remote_class: remote data provider class. Used only in remote=True
+    :param dict seek_cache: paths the registry paths were already populated with,
+        shared by the nested values, so repeated registry paths are sought once
     :return dict | str | list: modified input dict with refgenie paths populated
     """
-    p = re.compile("refgenie://([A-Za-z0-9_/\.\:]+)?")
-    partial_args = dict()
-
-    # prepare partial function based on operation mode
-    if remote_class is not None:
-        partial_args.update(dict(remote_class=remote_class))
-    _pop = partial(
-        rgc.populate if seek_method_name == "seek" else rgc.populater,
-        **partial_args,
-    )
-
+    if seek_cache is None:
+        seek_cache = {}
     if isinstance(glob, str):
-        it = re.finditer(p, glob)
-        for m in it:
+        # most values hold no registry path; skip the regex for those
+        if "refgenie://" not in glob:
+            return glob
+        # resolve the seek method once, not for every matched registry path
+        seek_method = getattr(rgc, seek_method_name)
+        for m in _REGISTRY_PATH_RE.finditer(glob):
             reg_path = m.group()
             rgpkg = prp(reg_path)
             if not rgpkg:
@@ -3432,21 +3916,35 @@ def _populate_refgenie_registry_path(rgc, glob, seek_method_name, remote_class=N
                     f" {reg_path}"
                 )
                 return glob
-            args = dict(
-                genome_name=rgpkg["namespace"],
-                asset_name=rgpkg["item"],
-                tag_name=rgpkg["tag"],
-                seek_key=rgpkg["subitem"],
-            )
-            if remote_class is not None:
-                args.update(dict(remote_class=remote_class))
-            rgpath = getattr(rgc, seek_method_name)(**args)
+            try:
+                rgpath = seek_cache[reg_path]
+            except KeyError:
+                args = dict(
+                    genome_name=rgpkg["namespace"],
+                    asset_name=rgpkg["item"],
+                    tag_name=rgpkg["tag"],
+                    seek_key=rgpkg["subitem"],
+                )
+                if remote_class is not None:
+                    args.update(dict(remote_class=remote_class))
+                rgpath = seek_cache[reg_path] = seek_method(**args)
             if rgpath is None:
                 _LOGGER.warning(f"'{reg_path}' refgenie registry path not populated.")
                 continue
-            glob = re.sub(reg_path, rgpath, glob)
+            # the registry path is a literal, not a pattern
+            glob = glob.replace(reg_path, rgpath)
         return glob
-    elif isinstance(glob, dict):
+
+    # prepare partial function based on operation mode; the nested values
+    # share the seek results
+    _pop = partial(
+        _populate_refgenie_registry_path,
+        rgc,
+        seek_method_name=seek_method_name,
+        remote_class=remote_class,
+        seek_cache=seek_cache,
+    )
+    if isinstance(glob, dict):
         for k, v in glob.items():
             if k.startswith("_"):
                 continue
@@ -15,6 +15,8 @@ with open("requirements/requirements-all.txt", "r") as reqs_file:
 
 # Additional keyword arguments for setup().
 extra = {"install_requires": DEPENDENCIES}
+# Optional dependencies; orjson speeds up parsing of the server responses
+extra["extras_require"] = {"speedups": ["orjson"]}
 
 with open("refgenconf/_version.py", "r") as versionfile:
     version = versionfile.readline().split()[-1].strip("\"'\n")
@@ -140,3 +140,34 @@ def test_pull_asset_works_with_nonwritable_and_writable_rgc(
         rgc.pull(gname, aname, tname)
     if state:
         rgc.make_readonly()
+
+
+class TestChkDigestUpdateChild:
+    def test_parent_tag_missing_locally_is_populated(self, tmpdir):
+        """The remote parent digest is recorded if only another tag exists locally"""
+        rgc = RefGenConf(
+            entries={
+                CFG_FOLDER_KEY: tmpdir.strpath,
+                CFG_GENOMES_KEY: None,
+                CFG_SERVERS_KEY: [DEFAULT_SERVER],
+            }
+        )
+        rgc.set_genome_alias(
+            genome="gen", digest="gen_digest", create_genome=True, no_write=True
+        )
+        rgc.update_tags(
+            "gen", "fasta", "default", {CFG_ASSET_CHECKSUM_KEY: "local_digest"}
+        )
+        with mock.patch(
+            "refgenconf.refgenconf.construct_request_url",
+            return_value="{genome}/{asset}/{tag}",
+        ), mock.patch(
+            "refgenconf.refgenconf.send_data_request", return_value="remote_digest"
+        ):
+            rgc.chk_digest_update_child(
+                "gen", "fasta:other", "bowtie2_index:default", DEFAULT_SERVER
+            )
+        tags = rgc[CFG_GENOMES_KEY]["gen"][CFG_ASSETS_KEY]["fasta"][CFG_ASSET_TAGS_KEY]
+        assert tags["other"][CFG_ASSET_CHECKSUM_KEY] == "remote_digest"
+        assert tags["default"][CFG_ASSET_CHECKSUM_KEY] == "local_digest"
+        assert "bowtie2_index:default" in tags["other"][CFG_ASSET_CHILDREN_KEY]
@@ -72,3 +72,21 @@ class TestAdd:
             genome_name=gname, asset_name="fasta", tag_name=tname, enclosing_dir=True
         )
         assert rgc.add(path, gname, aname, tname, seek_keys={"file": "b"}, force=True)
+
+    @pytest.mark.parametrize("gname", ["human_repeats", "rCRSd"])
+    def test_batch_add(self, cfg_file, gname):
+        rgc = RefGenConf(filepath=cfg_file)
+        path = rgc.seek(
+            genome_name=gname,
+            asset_name="fasta",
+            tag_name="default",
+            enclosing_dir=True,
+        )
+        entries = [
+            dict(path=path, genome=gname, asset=a, tag="default", force=True)
+            for a in ["test_asset2", "test_asset3"]
+        ]
+        entries.append(dict(path=path, genome=gname + "_new", asset="test_asset4"))
+        assert rgc.batch_add(entries) == [True, True, False]
+        assert "test_asset2" in rgc.list_assets_by_genome(gname)
+        assert "test_asset3" in rgc.list_assets_by_genome(gname)
@@ -1,10 +1,12 @@
 import os
 from shutil import rmtree
 
+import mock
 import pytest
 from yacman import UndefinedAliasError
 
-from refgenconf.const import CFG_ALIASES_KEY, CFG_GENOMES_KEY
+from refgenconf import RefGenConf
+from refgenconf.const import CFG_ALIASES_KEY, CFG_ASSET_PATH_KEY, CFG_GENOMES_KEY
 
 DEMO_FILES = ["demo.fa.gz", "demo2.fa", "demo3.fa", "demo4.fa", "demo5.fa.gz"]
 
@@ -123,6 +125,55 @@ class TestAliasGetting:
         with pytest.raises(UndefinedAliasError):
             my_rgc.get_genome_alias(digest=digest, fallback=True)
 
+    def test_get_genome_alias_reflects_alias_changes(self, tmpdir):
+        cfg = tmpdir.join("genomes.yaml")
+        cfg.write(f"genome_folder: {tmpdir.strpath}\ngenomes: null\n")
+        rgc = RefGenConf(filepath=cfg.strpath)
+        rgc.set_genome_alias(genome="a1", digest="test_digest", create_genome=True)
+        assert rgc.get_genome_alias(digest="test_digest") == "a1"
+        rgc.set_genome_alias(genome="a2", digest="test_digest")
+        assert rgc.get_genome_alias(digest="test_digest", all_aliases=True) == [
+            "a1",
+            "a2",
+        ]
+        assert rgc.get_genome_alias_digest(alias="test_digest", fallback=True)
+        rgc.remove_genome_aliases(digest="test_digest", aliases=["a1"])
+        assert rgc.get_genome_alias(digest="test_digest") == "a2"
+        rgc.remove_genome_aliases(digest="test_digest")
+        with pytest.raises(UndefinedAliasError):
+            rgc.get_genome_alias(digest="test_digest")
+
+    def test_get_genome_alias_digest_reflects_alias_changes(self, tmpdir):
+        cfg = tmpdir.join("genomes.yaml")
+        cfg.write(f"genome_folder: {tmpdir.strpath}\ngenomes: null\n")
+        rgc = RefGenConf(filepath=cfg.strpath)
+        rgc.set_genome_alias(genome="a1", digest="test_digest", create_genome=True)
+        assert rgc.get_genome_alias_digest(alias="a1") == "test_digest"
+        rgc.set_genome_alias(genome="a2", digest="test_digest")
+        assert rgc.get_genome_alias_digest(alias="a2") == "test_digest"
+        rgc.remove_genome_aliases(digest="test_digest", aliases=["a1"])
+        with pytest.raises(UndefinedAliasError):
+            rgc.get_genome_alias_digest(alias="a1")
+        assert rgc.get_genome_alias_digest(alias="a2") == "test_digest"
+
+    def test_alias_lookups_reflect_genome_removal(self, tmpdir):
+        cfg = tmpdir.join("genomes.yaml")
+        cfg.write(f"genome_folder: {tmpdir.strpath}\ngenomes: null\n")
+        rgc = RefGenConf(filepath=cfg.strpath)
+        for alias in ["a1", "a2"]:
+            rgc.set_genome_alias(
+                genome=alias, digest=f"{alias}_digest", create_genome=True
+            )
+        for alias in ["a1", "a2"]:
+            rgc.update_tags(alias, "fasta", "default", {CFG_ASSET_PATH_KEY: "fasta"})
+        assert rgc.get_genome_alias(digest="a1_digest") == "a1"
+        assert rgc.get_genome_alias_digest(alias="a1") == "a1_digest"
+        rgc.cfg_remove_assets("a1", "fasta", "default")
+        with pytest.raises(UndefinedAliasError):
+            rgc.get_genome_alias(digest="a1_digest")
+        with pytest.raises(UndefinedAliasError):
+            rgc.get_genome_alias_digest(alias="a1")
+
 
 class TestAliasRemoval:
     @pytest.mark.parametrize(
@@ -182,3 +233,26 @@ class TestInitializeGenome:
         with my_rgc as r:
             del r[CFG_GENOMES_KEY][d]
         rmtree(os.path.join(my_rgc.alias_dir, fasta_name))
+
+    def test_unchanged_fasta_not_digested_again(self, my_rgc, fasta_path):
+        """
+        Initialize the same genome twice, check that the FASTA file digest
+        is reused the second time
+        """
+        fasta = os.path.join(fasta_path, "demo2.fa")
+        digests_path = os.path.join(my_rgc.data_dir, ".fasta_digests.json")
+        d, asds = my_rgc.initialize_genome(
+            fasta_path=fasta, alias="demo2", fasta_unzipped=True
+        )
+        assert os.path.isfile(digests_path)
+        with mock.patch(
+            "refgenconf.refgenconf.SeqColClient.load_fasta",
+            side_effect=AssertionError("FASTA digested again"),
+        ):
+            assert my_rgc.initialize_genome(
+                fasta_path=fasta, alias="demo2", fasta_unzipped=True
+            ) == (d, asds)
+        with my_rgc as r:
+            del r[CFG_GENOMES_KEY][d]
+        rmtree(os.path.join(my_rgc.alias_dir, "demo2"))
+        os.remove(digests_path)
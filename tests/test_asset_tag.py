@@ -1,8 +1,13 @@
 """ Tests for RefGenConf.tag. These tests depend on successful completion of tests is test_1pull_asset.py """
 
+import warnings
+
 import mock
 import pytest
 
+from refgenconf import RefGenConf
+from refgenconf.const import *
+
 
 class TestTagging:
     @pytest.mark.parametrize(
@@ -21,3 +26,28 @@ class TestTagging:
         with mock.patch("refgenconf.refgenconf.query_yes_no", return_value=True):
             my_rgc.tag(gname, aname, new_tname, tname)
         my_rgc.seek(gname, aname, tname)
+
+
+class TestDefaultTag:
+    @pytest.mark.parametrize(["gname", "aname"], [("rCRSd", "fasta")])
+    def test_first_tag_used_if_no_default(self, cfg_file, gname, aname):
+        """The first tag is used if the asset has no default tag defined"""
+        rgc = RefGenConf(filepath=cfg_file)
+        asset_mapping = rgc[CFG_GENOMES_KEY][gname][CFG_ASSETS_KEY][aname]
+        first_tag = next(iter(asset_mapping[CFG_ASSET_TAGS_KEY]))
+        del asset_mapping[CFG_ASSET_DEFAULT_TAG_KEY]
+        with pytest.warns(RuntimeWarning):
+            assert rgc.get_default_tag(gname, aname) == first_tag
+
+    @pytest.mark.parametrize(["gname", "aname"], [("rCRSd", "fasta")])
+    def test_missing_default_warned_once(self, cfg_file, gname, aname):
+        """The missing default tag is reported just once per asset"""
+        rgc = RefGenConf(filepath=cfg_file)
+        del rgc[CFG_GENOMES_KEY][gname][CFG_ASSETS_KEY][aname][
+            CFG_ASSET_DEFAULT_TAG_KEY
+        ]
+        with pytest.warns(RuntimeWarning):
+            first_tag = rgc.get_default_tag(gname, aname)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert rgc.get_default_tag(gname, aname) == first_tag
@@ -2,6 +2,7 @@
 
 import os
 
+import mock
 import pytest
 from attmap import PathExAttMap
 from yacman import AliasedYacAttMap
@@ -52,3 +53,24 @@ class TestRefGenConf:
     def test_errors_on_old_cfg(self, cfg_file_old):
         with pytest.raises(ConfigNotCompliantError):
             RefGenConf(filepath=cfg_file_old)
+
+    def test_nested_update_contexts_write_once(self, tmpdir):
+        cfg_path = os.path.join(tmpdir.strpath, "genomes.yaml")
+        rgc = RefGenConf(
+            entries={
+                CFG_FOLDER_KEY: tmpdir.strpath,
+                CFG_GENOMES_KEY: None,
+                CFG_SERVERS_KEY: [DEFAULT_SERVER],
+            }
+        )
+        rgc.write(cfg_path)
+        rgc.make_readonly()
+        rgc = RefGenConf(filepath=cfg_path)
+        with mock.patch.object(RefGenConf, "write") as write:
+            with rgc as outer:
+                for servers in (["http://a.org"], ["http://b.org"]):
+                    with outer as inner:
+                        inner[CFG_SERVERS_KEY] = servers
+                assert write.call_count == 0
+        assert write.call_count == 1
+        assert rgc[CFG_SERVERS_KEY] == ["http://b.org"]
@@ -48,3 +48,15 @@ class TestGetAsset:
         assert os.path.join(ro_rgc[CFG_FOLDER_KEY], gname, aname, tname) != ro_rgc.seek(
             gname, aname, tname
         )
+
+    @pytest.mark.parametrize(
+        ["gname", "aname", "tname"],
+        [("rCRSd", "fasta", "default"), ("mouse_chrM2x", "fasta", "default")],
+    )
+    def test_only_requested_path_checked(self, ro_rgc, gname, aname, tname):
+        """Existence of just the returned path is checked when a single path is requested"""
+        checked = []
+        pth = ro_rgc.seek(
+            gname, aname, tname, check_exist=lambda p: checked.append(p) or True
+        )
+        assert checked == [pth]
@@ -1,7 +1,11 @@
 """ Tests for RefGenConf.getseq. These tests depend on successful completion of tests is test_1pull_asset.py """
 
+import mock
 import pytest
-from pyfaidx import FastaRecord, Sequence
+from pyfaidx import Fasta, FastaRecord, Sequence
+
+from refgenconf import RefGenConf
+from refgenconf.const import *
 
 
 class TestGetSeq:
@@ -19,3 +23,30 @@ class TestGetSeq:
         seq = ro_rgc.getseq(genome=gname, locus="{}:{}-{}".format(chr, start, end))
         assert isinstance(seq, Sequence)
         assert len(seq) == end - start
+
+    def test_getseq_opens_fasta_once(self, ro_rgc):
+        ro_rgc.close_fastas()
+        with mock.patch("pyfaidx.Fasta", wraps=Fasta) as fasta:
+            for start in range(1, 5):
+                ro_rgc.getseq(genome="rCRSd", locus="rCRSd:{}-20".format(start))
+        assert fasta.call_count == 1
+        ro_rgc.close_fastas()
+
+    def test_replaced_fasta_not_served_stale(self, tmpdir):
+        fasta = tmpdir.join("gen.fa")
+        fasta.write(">chr1\nAAAA\n")
+        rgc = RefGenConf(
+            entries={
+                CFG_FOLDER_KEY: tmpdir.strpath,
+                CFG_GENOMES_KEY: None,
+                CFG_SERVERS_KEY: [DEFAULT_SERVER],
+            }
+        )
+        with mock.patch.object(RefGenConf, "seek_src", return_value=fasta.strpath):
+            assert rgc.getseq(genome="gen", locus="chr1", as_str=True) == "AAAA"
+            fasta.write(">chr1\nCCCCCCCC\n")
+            rgc.initialize_genome(
+                fasta_path=fasta.strpath, alias="gen", fasta_unzipped=True
+            )
+            assert rgc.getseq(genome="gen", locus="chr1", as_str=True) == "CCCCCCCC"
+        rgc.close_fastas()
@@ -47,6 +47,20 @@ class ListTest:
         with ro_rgc as r:
             del r["genomes"]["test_digest"]
 
+    def test_assets_str_no_asset_section(self, ro_rgc):
+        """Verify the assets text skips genomes with no 'assets' section"""
+        ori_assets_str = ro_rgc.assets_str()
+        ro_rgc.set_genome_alias(
+            genome="test_alias",
+            digest="test_digest",
+            create_genome=True,
+        )
+        assert "test_alias" not in ro_rgc.assets_str()
+        ro_rgc.remove_genome_aliases(digest="test_digest")
+        with ro_rgc as r:
+            del r["genomes"]["test_digest"]
+        assert ro_rgc.assets_str() == ori_assets_str
+
 
 class ListByGenomeTest:
     def test_returns_entire_mapping_when_no_genonome_specified(self, my_rgc):
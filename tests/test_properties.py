@@ -29,3 +29,12 @@ class PropertiesTests:
     @staticmethod
     def test_file_path_returns_none_if_not_bound_to_file():
         assert RefGenConf().file_path is None
+
+    @pytest.mark.parametrize("prop_name", ["data_dir", "alias_dir"])
+    def test_path_props_follow_genome_folder_changes(self, tmpdir, prop_name):
+        rgc = RefGenConf(entries={"genome_folder": tmpdir.strpath})
+        assert getattr(rgc, prop_name).startswith(tmpdir.strpath)
+        new_folder = tmpdir.mkdir("new").strpath
+        rgc["genome_folder"] = new_folder
+        assert getattr(rgc, prop_name).startswith(new_folder)
+        assert list(rgc.keys()) == list(rgc.to_dict().keys())
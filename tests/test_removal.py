@@ -3,6 +3,7 @@
 import mock
 import pytest
 
+from refgenconf import RefGenConf
 from refgenconf.const import *
 from refgenconf.exceptions import *
 
@@ -32,3 +33,13 @@ class TestRemoveAssets:
                 my_rgc.remove(gname, aname, t)
         with pytest.raises(MissingAssetError):
             my_rgc.seek(gname, aname, t)
+
+    def test_last_asset_removal_by_alias(self, tmpdir):
+        """The genomes section is emptied when the last asset is removed by alias"""
+        cfg = tmpdir.join("genomes.yaml")
+        cfg.write(f"genome_folder: {tmpdir.strpath}\ngenomes: null\n")
+        rgc = RefGenConf(filepath=cfg.strpath)
+        rgc.set_genome_alias(genome="hg", digest="hg_digest", create_genome=True)
+        rgc.update_tags("hg", "fasta", "default", {CFG_ASSET_PATH_KEY: "fasta"})
+        rgc.cfg_remove_assets("hg", "fasta", "default")
+        assert rgc[CFG_GENOMES_KEY] is None
@@ -1,7 +1,10 @@
 from collections import Mapping
+from hashlib import md5
 
 import pytest
 
+from refgenconf import get_dir_digest
+
 
 @pytest.mark.parametrize(["genome", "asset", "tag"], [("rCRSd", "fasta", "default")])
 def test_is_asset_complete_returns_correct_result(genome, asset, tag, my_rgc):
@@ -12,3 +15,12 @@ def test_is_asset_complete_returns_correct_result(genome, asset, tag, my_rgc):
 @pytest.mark.parametrize("genome", ["rCRSd"])
 def test_get_genome_attributes(genome, my_rgc):
     assert isinstance(my_rgc.get_genome_attributes(genome), Mapping)
+
+
+def test_get_dir_digest_matches_md5_pipeline(tmpdir):
+    tmpdir.join("b.txt").write("b\n")
+    tmpdir.mkdir("a").join("f.txt").write("a\n")
+    tmpdir.mkdir("_refgenie_build").join("stats.txt").write("excluded\n")
+    file_digests = [md5(b"a\n").hexdigest(), md5(b"b\n").hexdigest()]
+    expected = md5("".join(d + "\n" for d in file_digests).encode()).hexdigest()
+    assert get_dir_digest(tmpdir.strpath) == expected